@@ -20,9 +20,10 @@ Security:
 Dependencies: None (foundation class for all stacks)
 """
 
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 from aws_cdk import Stack, Tags
 from constructs import Construct
+from lib.constructs.tagging_utility import STANDARD_TAGS
 
 
 class ShowCoreBaseStack(Stack):
@@ -90,6 +91,9 @@ class ShowCoreBaseStack(Stack):
         # Store component for use by child stacks
         self.component = component
         
+        # Cache of generated resource names, keyed by (resource_type, suffix)
+        self._resource_names: Dict[Tuple[str, Optional[str]], str] = {}
+        
         # Set default removal policy (RETAIN for production, DESTROY for dev/staging)
         from aws_cdk import RemovalPolicy
         self.removal_policy = RemovalPolicy.RETAIN if self._env_name == "production" else RemovalPolicy.DESTROY
@@ -107,6 +111,32 @@ class ShowCoreBaseStack(Stack):
         """
         return self._env_name
     
+    def get_context_values(self, defaults: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Read several context values in a single pass.
+        
+        Each key falls back to its default only when it is not set in context,
+        so explicit falsy values (e.g. enable_nat_gateway=false) are preserved.
+        
+        Usage:
+            config = self.get_context_values({
+                "vpc_cidr": "10.0.0.0/16",
+                "enable_nat_gateway": False,
+            })
+        
+        Args:
+            defaults: Mapping of context key to default value
+            
+        Returns:
+            Mapping of context key to resolved value
+        """
+        try_get_context = self.node.try_get_context
+        values = {}
+        for key, default in defaults.items():
+            value = try_get_context(key)
+            values[key] = default if value is None else value
+        return values
+    
     def _apply_standard_tags(self) -> None:
         """
         Apply standard tags to all resources in this stack.
@@ -127,16 +157,16 @@ class ShowCoreBaseStack(Stack):
         Optional Tags:
         - Component: Network/Database/Cache/etc (identifies the infrastructure component)
         """
-        # Required tags for all resources
-        Tags.of(self).add("Project", "ShowCore")
-        Tags.of(self).add("Phase", "Phase1")
-        Tags.of(self).add("Environment", self._env_name)
-        Tags.of(self).add("ManagedBy", "CDK")
-        Tags.of(self).add("CostCenter", "Engineering")
+        # One Tags instance for every tag applied to this stack
+        stack_tags = Tags.of(self)
+        
+        # Required tags for all resources, using the environment resolved in __init__
+        for key, value in (*STANDARD_TAGS.items(), ("Environment", self._env_name)):
+            stack_tags.add(key, value)
         
         # Optional component tag
         if self.component:
-            Tags.of(self).add("Component", self.component)
+            stack_tags.add("Component", self.component)
     
     def get_resource_name(
         self,
@@ -170,6 +200,12 @@ class ShowCoreBaseStack(Stack):
         Raises:
             ValueError: If component is not set
         """
+        # Names only depend on component and environment, so reuse earlier results
+        cache_key = (resource_type, suffix)
+        cached_name = self._resource_names.get(cache_key)
+        if cached_name is not None:
+            return cached_name
+        
         if not self.component:
             raise ValueError(
                 "Component must be set to generate resource names. "
@@ -190,7 +226,30 @@ class ShowCoreBaseStack(Stack):
         if suffix:
             parts.append(suffix)
         
-        return "-".join(parts)
+        resource_name = "-".join(parts)
+        self._resource_names[cache_key] = resource_name
+        return resource_name
+    
+    def get_export_name(self, name: str) -> str:
+        """
+        Generate a CloudFormation export name for this stack.
+        
+        Export names must be unique per account and region. Set the env_suffix
+        context value (e.g. "Staging") to deploy several environments side by
+        side; without it the historical names are kept unchanged.
+        
+        Examples:
+        - ShowCoreVpcId (no env_suffix)
+        - ShowCoreStagingVpcId (env_suffix=Staging)
+        
+        Args:
+            name: Export name without the ShowCore prefix (e.g., "VpcId")
+            
+        Returns:
+            Export name
+        """
+        env_suffix = self.node.try_get_context("env_suffix") or ""
+        return f"ShowCore{env_suffix}{name}"
     
     def add_component_tag(self, component: str) -> None:
         """
@@ -203,6 +262,7 @@ class ShowCoreBaseStack(Stack):
             component: Component name (Network, Database, Cache, Storage, CDN, Monitoring, Backup)
         """
         self.component = component
+        self._resource_names.clear()  # Cached names embed the old component
         Tags.of(self).add("Component", component)
     
     def add_custom_tag(self, key: str, value: str) -> None:
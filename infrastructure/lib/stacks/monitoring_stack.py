@@ -21,7 +21,7 @@ Security:
 Dependencies: None (foundation stack for monitoring)
 """
 
-from typing import List
+from typing import List, Optional
 from aws_cdk import (
     Duration,
     aws_sns as sns,
@@ -30,11 +30,18 @@ from aws_cdk import (
     aws_sns_subscriptions as subscriptions,
     aws_logs as logs,
     CfnOutput,
+    Fn,
 )
 from constructs import Construct
 from .base_stack import ShowCoreBaseStack
 
 
+# Metric periods shared by all alarms and dashboard widgets
+PERIOD_5_MINUTES = Duration.minutes(5)
+PERIOD_6_HOURS = Duration.hours(6)  # 6 hours = 21600 seconds
+PERIOD_1_DAY = Duration.days(1)  # S3 storage metrics are reported daily
+
+
 class ShowCoreMonitoringStack(ShowCoreBaseStack):
     """
     Monitoring infrastructure stack for ShowCore Phase 1.
@@ -67,7 +74,7 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
     - CloudWatch Alarm: ElastiCache memory utilization > 80% (critical)
     - CloudWatch Alarm: ElastiCache evictions > 0 (warning)
     - CloudWatch Alarm: ElastiCache cache hit rate < 80% (warning)
-    - CloudWatch Dashboard: ShowCore-Phase1-Dashboard
+    - CloudWatch Dashboard: ShowCore-Phase1-Dashboard (unless enable_dashboard=false)
       - RDS metrics: CPU, connections, latency, storage
       - ElastiCache metrics: CPU, memory, evictions, cache hits/misses
       - S3 metrics: bucket size, object count, errors
@@ -116,6 +123,11 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
             alarm_emails
         )
         
+        # Create one SNS alarm action per topic, shared by every alarm that notifies it
+        self._critical_alarm_action = cloudwatch_actions.SnsAction(self.critical_alerts_topic)
+        self._warning_alarm_action = cloudwatch_actions.SnsAction(self.warning_alerts_topic)
+        self._billing_alarm_action = cloudwatch_actions.SnsAction(self.billing_alerts_topic)
+        
         # Create billing alarms
         self._create_billing_alarms(billing_thresholds)
         
@@ -134,18 +146,27 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
         s3_bucket_name = self.node.try_get_context("s3_static_assets_bucket") or "showcore-static-assets"
         self._create_s3_alarms(s3_bucket_name)
         
-        # Create CloudWatch dashboard
-        self.dashboard = self._create_cloudwatch_dashboard()
+        # Create CloudWatch dashboard (optional)
+        # Ephemeral/dev environments can set enable_dashboard=false to skip
+        # building ~20 dashboard widgets on every synth
+        enable_dashboard = self.node.try_get_context("enable_dashboard")
+        if enable_dashboard is None:
+            enable_dashboard = True  # Default to True so production keeps its dashboard
+        self.dashboard: Optional[cloudwatch.Dashboard] = None
+        if enable_dashboard not in (False, "false"):  # -c enable_dashboard=false arrives as a string
+            self.dashboard = self._create_cloudwatch_dashboard()
         
         # Configure CloudWatch log retention
         self._configure_log_retention()
         
-        # Export SNS topic ARNs for use by other stacks
+        # Output SNS topic ARNs (informational only)
+        # Dependent stacks receive the topic constructs directly (see app.py), so
+        # no named exports are needed; named exports add rows to the account-wide
+        # CloudFormation exports table and block updates while importers exist
         CfnOutput(
             self,
             "CriticalAlertsTopicArn",
             value=self.critical_alerts_topic.topic_arn,
-            export_name="ShowCoreCriticalAlertsTopicArn",
             description="ARN of SNS topic for critical alerts"
         )
         
@@ -153,7 +174,6 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
             self,
             "WarningAlertsTopicArn",
             value=self.warning_alerts_topic.topic_arn,
-            export_name="ShowCoreWarningAlertsTopicArn",
             description="ARN of SNS topic for warning alerts"
         )
         
@@ -161,7 +181,6 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
             self,
             "BillingAlertsTopicArn",
             value=self.billing_alerts_topic.topic_arn,
-            export_name="ShowCoreBillingAlertsTopicArn",
             description="ARN of SNS topic for billing alerts"
         )
     
@@ -219,31 +238,31 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
         
         Validates: Requirements 1.2, 1.3, 9.7, 9.8
         """
+        # All thresholds watch the same metric, so build it once
+        # Note: Billing metrics are only available in us-east-1
+        # Evaluation period is 6 hours (21600 seconds) to reduce false positives
+        estimated_charges = cloudwatch.Metric(
+            namespace="AWS/Billing",
+            metric_name="EstimatedCharges",
+            dimensions_map={
+                "Currency": "USD"
+            },
+            statistic=cloudwatch.Stats.MAXIMUM,
+            period=PERIOD_6_HOURS
+        )
+        
         for threshold in thresholds:
             # Determine alarm name and severity based on threshold
             alarm_name = f"showcore-billing-{threshold}"
             alarm_description = f"Alert when estimated charges exceed ${threshold}"
             
-            # Both alarms send to billing alerts topic as per task requirements
-            alarm_topic = self.billing_alerts_topic
-            
             # Create billing alarm
-            # Note: Billing metrics are only available in us-east-1
-            # Evaluation period is 6 hours (21600 seconds) to reduce false positives
             alarm = cloudwatch.Alarm(
                 self,
                 f"BillingAlarm{threshold}",
                 alarm_name=alarm_name,
                 alarm_description=alarm_description,
-                metric=cloudwatch.Metric(
-                    namespace="AWS/Billing",
-                    metric_name="EstimatedCharges",
-                    dimensions_map={
-                        "Currency": "USD"
-                    },
-                    statistic="Maximum",
-                    period=Duration.hours(6)  # 6 hours = 21600 seconds
-                ),
+                metric=estimated_charges,
                 threshold=threshold,
                 evaluation_periods=1,
                 comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
@@ -251,9 +270,8 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
             )
             
             # Add SNS action to billing alerts topic
-            alarm.add_alarm_action(
-                cloudwatch_actions.SnsAction(alarm_topic)
-            )
+            # Both alarms send to billing alerts topic as per task requirements
+            alarm.add_alarm_action(self._billing_alarm_action)
             
             # Output alarm ARN
             CfnOutput(
@@ -280,6 +298,9 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
         Args:
             rds_instance_id: RDS instance identifier for metric dimensions
         """
+        # Metric dimensions shared by all RDS alarms
+        rds_dimensions = {"DBInstanceIdentifier": rds_instance_id}
+        
         # RDS CPU Utilization Alarm (Critical)
         rds_cpu_alarm = cloudwatch.Alarm(
             self,
@@ -289,9 +310,9 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
             metric=cloudwatch.Metric(
                 namespace="AWS/RDS",
                 metric_name="CPUUtilization",
-                dimensions_map={"DBInstanceIdentifier": rds_instance_id},
-                statistic="Average",
-                period=Duration.minutes(5)
+                dimensions_map=rds_dimensions,
+                statistic=cloudwatch.Stats.AVERAGE,
+                period=PERIOD_5_MINUTES
             ),
             threshold=80,
             evaluation_periods=1,
@@ -300,9 +321,7 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
         )
         
         # Add SNS action to critical alerts topic
-        rds_cpu_alarm.add_alarm_action(
-            cloudwatch_actions.SnsAction(self.critical_alerts_topic)
-        )
+        rds_cpu_alarm.add_alarm_action(self._critical_alarm_action)
         
         # RDS Storage Utilization Alarm (Warning)
         # FreeStorageSpace is in bytes, so we need to calculate 15% of total storage
@@ -315,9 +334,9 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
             metric=cloudwatch.Metric(
                 namespace="AWS/RDS",
                 metric_name="FreeStorageSpace",
-                dimensions_map={"DBInstanceIdentifier": rds_instance_id},
-                statistic="Average",
-                period=Duration.minutes(5)
+                dimensions_map=rds_dimensions,
+                statistic=cloudwatch.Stats.AVERAGE,
+                period=PERIOD_5_MINUTES
             ),
             threshold=3221225472,  # 3 GB in bytes (15% of 20 GB)
             evaluation_periods=1,
@@ -326,9 +345,7 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
         )
         
         # Add SNS action to warning alerts topic
-        rds_storage_alarm.add_alarm_action(
-            cloudwatch_actions.SnsAction(self.warning_alerts_topic)
-        )
+        rds_storage_alarm.add_alarm_action(self._warning_alarm_action)
         
         # RDS Connection Count Alarm (Warning)
         rds_connections_alarm = cloudwatch.Alarm(
@@ -339,9 +356,9 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
             metric=cloudwatch.Metric(
                 namespace="AWS/RDS",
                 metric_name="DatabaseConnections",
-                dimensions_map={"DBInstanceIdentifier": rds_instance_id},
-                statistic="Average",
-                period=Duration.minutes(5)
+                dimensions_map=rds_dimensions,
+                statistic=cloudwatch.Stats.AVERAGE,
+                period=PERIOD_5_MINUTES
             ),
             threshold=80,
             evaluation_periods=1,
@@ -350,9 +367,7 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
         )
         
         # Add SNS action to warning alerts topic
-        rds_connections_alarm.add_alarm_action(
-            cloudwatch_actions.SnsAction(self.warning_alerts_topic)
-        )
+        rds_connections_alarm.add_alarm_action(self._warning_alarm_action)
         
         # RDS Read Latency Alarm (Warning)
         # Latency is in seconds, so 100ms = 0.1 seconds
@@ -364,9 +379,9 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
             metric=cloudwatch.Metric(
                 namespace="AWS/RDS",
                 metric_name="ReadLatency",
-                dimensions_map={"DBInstanceIdentifier": rds_instance_id},
-                statistic="Average",
-                period=Duration.minutes(5)
+                dimensions_map=rds_dimensions,
+                statistic=cloudwatch.Stats.AVERAGE,
+                period=PERIOD_5_MINUTES
             ),
             threshold=0.1,  # 100ms in seconds
             evaluation_periods=1,
@@ -375,9 +390,7 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
         )
         
         # Add SNS action to warning alerts topic
-        rds_read_latency_alarm.add_alarm_action(
-            cloudwatch_actions.SnsAction(self.warning_alerts_topic)
-        )
+        rds_read_latency_alarm.add_alarm_action(self._warning_alarm_action)
         
         # RDS Write Latency Alarm (Warning)
         # Latency is in seconds, so 100ms = 0.1 seconds
@@ -389,9 +402,9 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
             metric=cloudwatch.Metric(
                 namespace="AWS/RDS",
                 metric_name="WriteLatency",
-                dimensions_map={"DBInstanceIdentifier": rds_instance_id},
-                statistic="Average",
-                period=Duration.minutes(5)
+                dimensions_map=rds_dimensions,
+                statistic=cloudwatch.Stats.AVERAGE,
+                period=PERIOD_5_MINUTES
             ),
             threshold=0.1,  # 100ms in seconds
             evaluation_periods=1,
@@ -400,9 +413,7 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
         )
         
         # Add SNS action to warning alerts topic
-        rds_write_latency_alarm.add_alarm_action(
-            cloudwatch_actions.SnsAction(self.warning_alerts_topic)
-        )
+        rds_write_latency_alarm.add_alarm_action(self._warning_alarm_action)
         
         # Output alarm ARNs
         CfnOutput(
@@ -457,6 +468,9 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
         Args:
             elasticache_cluster_id: ElastiCache cluster identifier for metric dimensions
         """
+        # Metric dimensions shared by all ElastiCache alarms
+        elasticache_dimensions = {"CacheClusterId": elasticache_cluster_id}
+        
         # ElastiCache CPU Utilization Alarm (Critical)
         elasticache_cpu_alarm = cloudwatch.Alarm(
             self,
@@ -466,9 +480,9 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
             metric=cloudwatch.Metric(
                 namespace="AWS/ElastiCache",
                 metric_name="CPUUtilization",
-                dimensions_map={"CacheClusterId": elasticache_cluster_id},
-                statistic="Average",
-                period=Duration.minutes(5)
+                dimensions_map=elasticache_dimensions,
+                statistic=cloudwatch.Stats.AVERAGE,
+                period=PERIOD_5_MINUTES
             ),
             threshold=75,
             evaluation_periods=1,
@@ -477,9 +491,7 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
         )
         
         # Add SNS action to critical alerts topic
-        elasticache_cpu_alarm.add_alarm_action(
-            cloudwatch_actions.SnsAction(self.critical_alerts_topic)
-        )
+        elasticache_cpu_alarm.add_alarm_action(self._critical_alarm_action)
         
         # ElastiCache Memory Utilization Alarm (Critical)
         elasticache_memory_alarm = cloudwatch.Alarm(
@@ -490,9 +502,9 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
             metric=cloudwatch.Metric(
                 namespace="AWS/ElastiCache",
                 metric_name="DatabaseMemoryUsagePercentage",
-                dimensions_map={"CacheClusterId": elasticache_cluster_id},
-                statistic="Average",
-                period=Duration.minutes(5)
+                dimensions_map=elasticache_dimensions,
+                statistic=cloudwatch.Stats.AVERAGE,
+                period=PERIOD_5_MINUTES
             ),
             threshold=80,
             evaluation_periods=1,
@@ -501,9 +513,7 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
         )
         
         # Add SNS action to critical alerts topic
-        elasticache_memory_alarm.add_alarm_action(
-            cloudwatch_actions.SnsAction(self.critical_alerts_topic)
-        )
+        elasticache_memory_alarm.add_alarm_action(self._critical_alarm_action)
         
         # ElastiCache Evictions Alarm (Warning)
         elasticache_evictions_alarm = cloudwatch.Alarm(
@@ -514,9 +524,9 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
             metric=cloudwatch.Metric(
                 namespace="AWS/ElastiCache",
                 metric_name="Evictions",
-                dimensions_map={"CacheClusterId": elasticache_cluster_id},
-                statistic="Sum",
-                period=Duration.minutes(5)
+                dimensions_map=elasticache_dimensions,
+                statistic=cloudwatch.Stats.SUM,
+                period=PERIOD_5_MINUTES
             ),
             threshold=0,
             evaluation_periods=1,
@@ -525,9 +535,7 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
         )
         
         # Add SNS action to warning alerts topic
-        elasticache_evictions_alarm.add_alarm_action(
-            cloudwatch_actions.SnsAction(self.warning_alerts_topic)
-        )
+        elasticache_evictions_alarm.add_alarm_action(self._warning_alarm_action)
         
         # ElastiCache Cache Hit Rate Alarm (Warning)
         # Cache hit rate is calculated as: CacheHits / (CacheHits + CacheMisses) * 100
@@ -544,16 +552,16 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
                     "hits": cloudwatch.Metric(
                         namespace="AWS/ElastiCache",
                         metric_name="CacheHits",
-                        dimensions_map={"CacheClusterId": elasticache_cluster_id},
-                        statistic="Sum",
-                        period=Duration.minutes(5)
+                        dimensions_map=elasticache_dimensions,
+                        statistic=cloudwatch.Stats.SUM,
+                        period=PERIOD_5_MINUTES
                     ),
                     "misses": cloudwatch.Metric(
                         namespace="AWS/ElastiCache",
                         metric_name="CacheMisses",
-                        dimensions_map={"CacheClusterId": elasticache_cluster_id},
-                        statistic="Sum",
-                        period=Duration.minutes(5)
+                        dimensions_map=elasticache_dimensions,
+                        statistic=cloudwatch.Stats.SUM,
+                        period=PERIOD_5_MINUTES
                     )
                 },
                 label="Cache Hit Rate %"
@@ -565,9 +573,7 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
         )
         
         # Add SNS action to warning alerts topic
-        elasticache_cache_hit_rate_alarm.add_alarm_action(
-            cloudwatch_actions.SnsAction(self.warning_alerts_topic)
-        )
+        elasticache_cache_hit_rate_alarm.add_alarm_action(self._warning_alarm_action)
         
         # Output alarm ARNs
         CfnOutput(
@@ -618,6 +624,10 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
         Args:
             s3_bucket_name: S3 bucket name for metric dimensions
         """
+        # Metric dimensions shared by all S3 alarms
+        s3_dimensions = {"BucketName": s3_bucket_name}
+        s3_standard_storage_dimensions = {**s3_dimensions, "StorageType": "StandardStorage"}
+        
         # S3 Bucket Size Alarm (Warning)
         # 10 GB = 10,737,418,240 bytes
         s3_size_alarm = cloudwatch.Alarm(
@@ -628,12 +638,9 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
             metric=cloudwatch.Metric(
                 namespace="AWS/S3",
                 metric_name="BucketSizeBytes",
-                dimensions_map={
-                    "BucketName": s3_bucket_name,
-                    "StorageType": "StandardStorage"
-                },
-                statistic="Average",
-                period=Duration.days(1)  # S3 storage metrics are reported daily
+                dimensions_map=s3_standard_storage_dimensions,
+                statistic=cloudwatch.Stats.AVERAGE,
+                period=PERIOD_1_DAY
             ),
             threshold=10737418240,  # 10 GB in bytes
             evaluation_periods=1,
@@ -642,9 +649,7 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
         )
         
         # Add SNS action to warning alerts topic
-        s3_size_alarm.add_alarm_action(
-            cloudwatch_actions.SnsAction(self.warning_alerts_topic)
-        )
+        s3_size_alarm.add_alarm_action(self._warning_alarm_action)
         
         # S3 4xx Error Rate Alarm (Warning)
         # Error rate is calculated as: (4xxErrors / AllRequests) * 100
@@ -661,16 +666,16 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
                     "errors": cloudwatch.Metric(
                         namespace="AWS/S3",
                         metric_name="4xxErrors",
-                        dimensions_map={"BucketName": s3_bucket_name},
-                        statistic="Sum",
-                        period=Duration.minutes(5)
+                        dimensions_map=s3_dimensions,
+                        statistic=cloudwatch.Stats.SUM,
+                        period=PERIOD_5_MINUTES
                     ),
                     "requests": cloudwatch.Metric(
                         namespace="AWS/S3",
                         metric_name="AllRequests",
-                        dimensions_map={"BucketName": s3_bucket_name},
-                        statistic="Sum",
-                        period=Duration.minutes(5)
+                        dimensions_map=s3_dimensions,
+                        statistic=cloudwatch.Stats.SUM,
+                        period=PERIOD_5_MINUTES
                     )
                 },
                 label="4xx Error Rate %"
@@ -682,9 +687,7 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
         )
         
         # Add SNS action to warning alerts topic
-        s3_4xx_alarm.add_alarm_action(
-            cloudwatch_actions.SnsAction(self.warning_alerts_topic)
-        )
+        s3_4xx_alarm.add_alarm_action(self._warning_alarm_action)
         
         # S3 5xx Error Rate Alarm (Critical)
         # Error rate is calculated as: (5xxErrors / AllRequests) * 100
@@ -701,16 +704,16 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
                     "errors": cloudwatch.Metric(
                         namespace="AWS/S3",
                         metric_name="5xxErrors",
-                        dimensions_map={"BucketName": s3_bucket_name},
-                        statistic="Sum",
-                        period=Duration.minutes(5)
+                        dimensions_map=s3_dimensions,
+                        statistic=cloudwatch.Stats.SUM,
+                        period=PERIOD_5_MINUTES
                     ),
                     "requests": cloudwatch.Metric(
                         namespace="AWS/S3",
                         metric_name="AllRequests",
-                        dimensions_map={"BucketName": s3_bucket_name},
-                        statistic="Sum",
-                        period=Duration.minutes(5)
+                        dimensions_map=s3_dimensions,
+                        statistic=cloudwatch.Stats.SUM,
+                        period=PERIOD_5_MINUTES
                     )
                 },
                 label="5xx Error Rate %"
@@ -722,9 +725,7 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
         )
         
         # Add SNS action to critical alerts topic
-        s3_5xx_alarm.add_alarm_action(
-            cloudwatch_actions.SnsAction(self.critical_alerts_topic)
-        )
+        s3_5xx_alarm.add_alarm_action(self._critical_alarm_action)
         
         # Output alarm ARNs
         CfnOutput(
@@ -779,6 +780,19 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
         s3_bucket_name = self.node.try_get_context("s3_static_assets_bucket") or "showcore-static-assets"
         cloudfront_distribution_id = self.node.try_get_context("cloudfront_distribution_id") or "DISTRIBUTION_ID"
         
+        # VPC Endpoint metrics require the VPC Endpoint ID
+        # This will be populated after VPC Endpoints are created
+        vpc_endpoint_id = self.node.try_get_context("vpc_endpoint_id") or "vpce-placeholder"
+        
+        # Metric dimensions, built once and shared by every widget for a resource
+        rds_dimensions = {"DBInstanceIdentifier": rds_instance_id}
+        elasticache_dimensions = {"CacheClusterId": elasticache_cluster_id}
+        s3_dimensions = {"BucketName": s3_bucket_name}
+        s3_standard_storage_dimensions = {**s3_dimensions, "StorageType": "StandardStorage"}
+        s3_all_storage_dimensions = {**s3_dimensions, "StorageType": "AllStorageTypes"}
+        cloudfront_dimensions = {"DistributionId": cloudfront_distribution_id}
+        vpc_endpoint_dimensions = {"VPC Endpoint Id": vpc_endpoint_id}
+        
         # RDS Metrics Section
         dashboard.add_widgets(
             cloudwatch.GraphWidget(
@@ -787,9 +801,9 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
                     cloudwatch.Metric(
                         namespace="AWS/RDS",
                         metric_name="CPUUtilization",
-                        dimensions_map={"DBInstanceIdentifier": rds_instance_id},
-                        statistic="Average",
-                        period=Duration.minutes(5),
+                        dimensions_map=rds_dimensions,
+                        statistic=cloudwatch.Stats.AVERAGE,
+                        period=PERIOD_5_MINUTES,
                         label="CPU %"
                     )
                 ],
@@ -802,9 +816,9 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
                     cloudwatch.Metric(
                         namespace="AWS/RDS",
                         metric_name="DatabaseConnections",
-                        dimensions_map={"DBInstanceIdentifier": rds_instance_id},
-                        statistic="Average",
-                        period=Duration.minutes(5),
+                        dimensions_map=rds_dimensions,
+                        statistic=cloudwatch.Stats.AVERAGE,
+                        period=PERIOD_5_MINUTES,
                         label="Connections"
                     )
                 ],
@@ -820,17 +834,17 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
                     cloudwatch.Metric(
                         namespace="AWS/RDS",
                         metric_name="ReadLatency",
-                        dimensions_map={"DBInstanceIdentifier": rds_instance_id},
-                        statistic="Average",
-                        period=Duration.minutes(5),
+                        dimensions_map=rds_dimensions,
+                        statistic=cloudwatch.Stats.AVERAGE,
+                        period=PERIOD_5_MINUTES,
                         label="Read Latency (ms)"
                     ),
                     cloudwatch.Metric(
                         namespace="AWS/RDS",
                         metric_name="WriteLatency",
-                        dimensions_map={"DBInstanceIdentifier": rds_instance_id},
-                        statistic="Average",
-                        period=Duration.minutes(5),
+                        dimensions_map=rds_dimensions,
+                        statistic=cloudwatch.Stats.AVERAGE,
+                        period=PERIOD_5_MINUTES,
                         label="Write Latency (ms)"
                     )
                 ],
@@ -843,9 +857,9 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
                     cloudwatch.Metric(
                         namespace="AWS/RDS",
                         metric_name="FreeStorageSpace",
-                        dimensions_map={"DBInstanceIdentifier": rds_instance_id},
-                        statistic="Average",
-                        period=Duration.minutes(5),
+                        dimensions_map=rds_dimensions,
+                        statistic=cloudwatch.Stats.AVERAGE,
+                        period=PERIOD_5_MINUTES,
                         label="Free Storage (bytes)"
                     )
                 ],
@@ -862,9 +876,9 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
                     cloudwatch.Metric(
                         namespace="AWS/ElastiCache",
                         metric_name="CPUUtilization",
-                        dimensions_map={"CacheClusterId": elasticache_cluster_id},
-                        statistic="Average",
-                        period=Duration.minutes(5),
+                        dimensions_map=elasticache_dimensions,
+                        statistic=cloudwatch.Stats.AVERAGE,
+                        period=PERIOD_5_MINUTES,
                         label="CPU %"
                     )
                 ],
@@ -877,9 +891,9 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
                     cloudwatch.Metric(
                         namespace="AWS/ElastiCache",
                         metric_name="DatabaseMemoryUsagePercentage",
-                        dimensions_map={"CacheClusterId": elasticache_cluster_id},
-                        statistic="Average",
-                        period=Duration.minutes(5),
+                        dimensions_map=elasticache_dimensions,
+                        statistic=cloudwatch.Stats.AVERAGE,
+                        period=PERIOD_5_MINUTES,
                         label="Memory %"
                     )
                 ],
@@ -895,9 +909,9 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
                     cloudwatch.Metric(
                         namespace="AWS/ElastiCache",
                         metric_name="Evictions",
-                        dimensions_map={"CacheClusterId": elasticache_cluster_id},
-                        statistic="Sum",
-                        period=Duration.minutes(5),
+                        dimensions_map=elasticache_dimensions,
+                        statistic=cloudwatch.Stats.SUM,
+                        period=PERIOD_5_MINUTES,
                         label="Evictions"
                     )
                 ],
@@ -910,17 +924,17 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
                     cloudwatch.Metric(
                         namespace="AWS/ElastiCache",
                         metric_name="CacheHits",
-                        dimensions_map={"CacheClusterId": elasticache_cluster_id},
-                        statistic="Sum",
-                        period=Duration.minutes(5),
+                        dimensions_map=elasticache_dimensions,
+                        statistic=cloudwatch.Stats.SUM,
+                        period=PERIOD_5_MINUTES,
                         label="Cache Hits"
                     ),
                     cloudwatch.Metric(
                         namespace="AWS/ElastiCache",
                         metric_name="CacheMisses",
-                        dimensions_map={"CacheClusterId": elasticache_cluster_id},
-                        statistic="Sum",
-                        period=Duration.minutes(5),
+                        dimensions_map=elasticache_dimensions,
+                        statistic=cloudwatch.Stats.SUM,
+                        period=PERIOD_5_MINUTES,
                         label="Cache Misses"
                     )
                 ],
@@ -937,12 +951,9 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
                     cloudwatch.Metric(
                         namespace="AWS/S3",
                         metric_name="BucketSizeBytes",
-                        dimensions_map={
-                            "BucketName": s3_bucket_name,
-                            "StorageType": "StandardStorage"
-                        },
-                        statistic="Average",
-                        period=Duration.days(1),
+                        dimensions_map=s3_standard_storage_dimensions,
+                        statistic=cloudwatch.Stats.AVERAGE,
+                        period=PERIOD_1_DAY,
                         label="Bucket Size (bytes)"
                     )
                 ],
@@ -950,12 +961,9 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
                     cloudwatch.Metric(
                         namespace="AWS/S3",
                         metric_name="NumberOfObjects",
-                        dimensions_map={
-                            "BucketName": s3_bucket_name,
-                            "StorageType": "AllStorageTypes"
-                        },
-                        statistic="Average",
-                        period=Duration.days(1),
+                        dimensions_map=s3_all_storage_dimensions,
+                        statistic=cloudwatch.Stats.AVERAGE,
+                        period=PERIOD_1_DAY,
                         label="Object Count"
                     )
                 ],
@@ -968,17 +976,17 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
                     cloudwatch.Metric(
                         namespace="AWS/S3",
                         metric_name="4xxErrors",
-                        dimensions_map={"BucketName": s3_bucket_name},
-                        statistic="Sum",
-                        period=Duration.minutes(5),
+                        dimensions_map=s3_dimensions,
+                        statistic=cloudwatch.Stats.SUM,
+                        period=PERIOD_5_MINUTES,
                         label="4xx Errors"
                     ),
                     cloudwatch.Metric(
                         namespace="AWS/S3",
                         metric_name="5xxErrors",
-                        dimensions_map={"BucketName": s3_bucket_name},
-                        statistic="Sum",
-                        period=Duration.minutes(5),
+                        dimensions_map=s3_dimensions,
+                        statistic=cloudwatch.Stats.SUM,
+                        period=PERIOD_5_MINUTES,
                         label="5xx Errors"
                     )
                 ],
@@ -995,9 +1003,9 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
                     cloudwatch.Metric(
                         namespace="AWS/CloudFront",
                         metric_name="Requests",
-                        dimensions_map={"DistributionId": cloudfront_distribution_id},
-                        statistic="Sum",
-                        period=Duration.minutes(5),
+                        dimensions_map=cloudfront_dimensions,
+                        statistic=cloudwatch.Stats.SUM,
+                        period=PERIOD_5_MINUTES,
                         label="Requests"
                     )
                 ],
@@ -1005,9 +1013,9 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
                     cloudwatch.Metric(
                         namespace="AWS/CloudFront",
                         metric_name="BytesDownloaded",
-                        dimensions_map={"DistributionId": cloudfront_distribution_id},
-                        statistic="Sum",
-                        period=Duration.minutes(5),
+                        dimensions_map=cloudfront_dimensions,
+                        statistic=cloudwatch.Stats.SUM,
+                        period=PERIOD_5_MINUTES,
                         label="Bytes Downloaded"
                     )
                 ],
@@ -1020,17 +1028,17 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
                     cloudwatch.Metric(
                         namespace="AWS/CloudFront",
                         metric_name="4xxErrorRate",
-                        dimensions_map={"DistributionId": cloudfront_distribution_id},
-                        statistic="Average",
-                        period=Duration.minutes(5),
+                        dimensions_map=cloudfront_dimensions,
+                        statistic=cloudwatch.Stats.AVERAGE,
+                        period=PERIOD_5_MINUTES,
                         label="4xx Error Rate %"
                     ),
                     cloudwatch.Metric(
                         namespace="AWS/CloudFront",
                         metric_name="5xxErrorRate",
-                        dimensions_map={"DistributionId": cloudfront_distribution_id},
-                        statistic="Average",
-                        period=Duration.minutes(5),
+                        dimensions_map=cloudfront_dimensions,
+                        statistic=cloudwatch.Stats.AVERAGE,
+                        period=PERIOD_5_MINUTES,
                         label="5xx Error Rate %"
                     )
                 ],
@@ -1046,9 +1054,9 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
                     cloudwatch.Metric(
                         namespace="AWS/CloudFront",
                         metric_name="CacheHitRate",
-                        dimensions_map={"DistributionId": cloudfront_distribution_id},
-                        statistic="Average",
-                        period=Duration.minutes(5),
+                        dimensions_map=cloudfront_dimensions,
+                        statistic=cloudwatch.Stats.AVERAGE,
+                        period=PERIOD_5_MINUTES,
                         label="Cache Hit Rate %"
                     )
                 ],
@@ -1058,10 +1066,6 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
         )
         
         # VPC Endpoint Metrics Section
-        # Note: VPC Endpoint metrics require the VPC Endpoint ID
-        # These will be populated after VPC Endpoints are created
-        vpc_endpoint_id = self.node.try_get_context("vpc_endpoint_id") or "vpce-placeholder"
-        
         dashboard.add_widgets(
             cloudwatch.GraphWidget(
                 title="VPC Endpoints - Network Traffic (Packets)",
@@ -1069,17 +1073,17 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
                     cloudwatch.Metric(
                         namespace="AWS/PrivateLinkEndpoints",
                         metric_name="PacketsReceived",
-                        dimensions_map={"VPC Endpoint Id": vpc_endpoint_id},
-                        statistic="Sum",
-                        period=Duration.minutes(5),
+                        dimensions_map=vpc_endpoint_dimensions,
+                        statistic=cloudwatch.Stats.SUM,
+                        period=PERIOD_5_MINUTES,
                         label="Packets Received"
                     ),
                     cloudwatch.Metric(
                         namespace="AWS/PrivateLinkEndpoints",
                         metric_name="PacketsSent",
-                        dimensions_map={"VPC Endpoint Id": vpc_endpoint_id},
-                        statistic="Sum",
-                        period=Duration.minutes(5),
+                        dimensions_map=vpc_endpoint_dimensions,
+                        statistic=cloudwatch.Stats.SUM,
+                        period=PERIOD_5_MINUTES,
                         label="Packets Sent"
                     )
                 ],
@@ -1092,17 +1096,17 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
                     cloudwatch.Metric(
                         namespace="AWS/PrivateLinkEndpoints",
                         metric_name="BytesReceived",
-                        dimensions_map={"VPC Endpoint Id": vpc_endpoint_id},
-                        statistic="Sum",
-                        period=Duration.minutes(5),
+                        dimensions_map=vpc_endpoint_dimensions,
+                        statistic=cloudwatch.Stats.SUM,
+                        period=PERIOD_5_MINUTES,
                         label="Bytes Received"
                     ),
                     cloudwatch.Metric(
                         namespace="AWS/PrivateLinkEndpoints",
                         metric_name="BytesSent",
-                        dimensions_map={"VPC Endpoint Id": vpc_endpoint_id},
-                        statistic="Sum",
-                        period=Duration.minutes(5),
+                        dimensions_map=vpc_endpoint_dimensions,
+                        statistic=cloudwatch.Stats.SUM,
+                        period=PERIOD_5_MINUTES,
                         label="Bytes Sent"
                     )
                 ],
@@ -1112,10 +1116,15 @@ class ShowCoreMonitoringStack(ShowCoreBaseStack):
         )
         
         # Output dashboard URL
+        # Fn::Sub resolves the region at deploy time, so the URL is correct even
+        # when the stack is deployed to a region other than the synth-time env
         CfnOutput(
             self,
             "DashboardUrl",
-            value=f"https://console.aws.amazon.com/cloudwatch/home?region={self.region}#dashboards:name={dashboard.dashboard_name}",
+            value=Fn.sub(
+                "https://console.aws.amazon.com/cloudwatch/home?region=${AWS::Region}#dashboards:name=${DashboardName}",
+                {"DashboardName": dashboard.dashboard_name}
+            ),
             description="URL to CloudWatch dashboard for ShowCore Phase 1"
         )
         
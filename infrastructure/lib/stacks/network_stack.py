@@ -29,6 +29,7 @@ Route Table Configuration:
 - Private subnet route tables: NO default route, only VPC Endpoint routes (automatic)
 - Gateway Endpoints automatically add routes to private route tables
 - Private subnets have NO internet access (PRIVATE_ISOLATED type ensures this)
+- See NETWORK_ROUTE_TABLES.md for the full route tables
 
 Resources Created:
 - VPC (10.0.0.0/16)
@@ -48,15 +49,61 @@ Dependencies: None (foundation stack)
 Validates: Requirements 2.1, 2.2, 2.3, 2.4, 2.5, 2.6, 2.7, 2.8, 2.9, 2.11, 2.12, 9.3, 9.4
 """
 
-from typing import List
+from __future__ import annotations
+
+from functools import cached_property, lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
 from aws_cdk import (
     aws_ec2 as ec2,
+    aws_ssm as ssm,
     CfnOutput,
+    Fn,
+    Stack,
 )
 from constructs import Construct
 from lib.stacks.base_stack import ShowCoreBaseStack
 
 
+# HTTPS port used by the Interface Endpoint security group rule
+HTTPS_PORT = ec2.Port.tcp(443)
+
+
+@lru_cache(maxsize=None)
+def _subnet_configurations(enable_nat_gateway: bool) -> Tuple[ec2.SubnetConfiguration, ...]:
+    """
+    Get the VPC subnet configurations.
+    
+    Cached per NAT setting so every ShowCoreNetworkStack instance in the same
+    process shares the same configuration objects.
+    
+    Args:
+        enable_nat_gateway: Whether private subnets route through a NAT Gateway
+        
+    Returns:
+        Public and private subnet configurations
+    """
+    return (
+        # Public subnets (10.0.0.0/24, 10.0.1.0/24)
+        # Route table: 0.0.0.0/0 → Internet Gateway (automatic)
+        ec2.SubnetConfiguration(
+            name="Public",
+            subnet_type=ec2.SubnetType.PUBLIC,
+            cidr_mask=24,  # 256 IPs per subnet
+        ),
+        # Private subnets (10.0.2.0/24, 10.0.3.0/24)
+        # Route table: NO default route (PRIVATE_ISOLATED ensures no internet access)
+        # Gateway Endpoints will automatically add routes to these route tables
+        # NO NAT Gateway route - will use VPC Endpoints for AWS service access
+        ec2.SubnetConfiguration(
+            name="Private",
+            subnet_type=(
+                ec2.SubnetType.PRIVATE_WITH_EGRESS if enable_nat_gateway else ec2.SubnetType.PRIVATE_ISOLATED
+            ),
+            cidr_mask=24,  # 256 IPs per subnet
+        ),
+    )
+
+
 class ShowCoreNetworkStack(ShowCoreBaseStack):
     """
     Network infrastructure stack for ShowCore Phase 1.
@@ -102,6 +149,19 @@ class ShowCoreNetworkStack(ShowCoreBaseStack):
     - PrivateSubnetIds: Private subnet IDs
     """
     
+    # Gateway Endpoints (construct ID, service) - FREE, routes added automatically
+    GATEWAY_ENDPOINTS = (
+        ("S3GatewayEndpoint", ec2.GatewayVpcEndpointAwsService.S3),
+        ("DynamoDBGatewayEndpoint", ec2.GatewayVpcEndpointAwsService.DYNAMODB),
+    )
+    
+    # Interface Endpoints (construct ID, service) - ~$7/month each, essential services only
+    INTERFACE_ENDPOINTS = (
+        ("CloudWatchLogsEndpoint", ec2.InterfaceVpcEndpointAwsService.CLOUDWATCH_LOGS),
+        ("CloudWatchMonitoringEndpoint", ec2.InterfaceVpcEndpointAwsService.CLOUDWATCH_MONITORING),
+        ("SystemsManagerEndpoint", ec2.InterfaceVpcEndpointAwsService.SSM),
+    )
+    
     def __init__(
         self,
         scope: Construct,
@@ -123,37 +183,70 @@ class ShowCoreNetworkStack(ShowCoreBaseStack):
             **kwargs
         )
         
-        # Get configuration from context
-        vpc_cidr = self.node.try_get_context("vpc_cidr") or "10.0.0.0/16"
-        enable_nat_gateway = self.node.try_get_context("enable_nat_gateway")
-        if enable_nat_gateway is None:
-            enable_nat_gateway = False  # Default to False for cost optimization
+        # Get configuration from context once; helpers read self._config
+        # instead of walking the construct tree again
+        self._config = self.get_context_values({
+            "vpc_cidr": "10.0.0.0/16",
+            "enable_nat_gateway": False,  # Default to False for cost optimization
+            "enable_interface_endpoints": True,  # Set False in dev to skip ~$21/month of endpoints
+            "availability_zones": None,  # e.g. ["us-east-1a", "us-east-1b"]
+            "disable_private_dns": False,
+        })
+        self._config["enable_nat_gateway"] = self._config["enable_nat_gateway"] in (True, "true")
+        self._config["enable_interface_endpoints"] = self._config["enable_interface_endpoints"] not in (False, "false")
+        self._config["disable_private_dns"] = self._config["disable_private_dns"] in (True, "true")
         
         # Create VPC with multi-AZ subnets
         # DO NOT create NAT Gateway (cost optimization - saves ~$32/month)
-        self.vpc = self._create_vpc(vpc_cidr, enable_nat_gateway)
+        self.vpc = self._create_vpc(
+            self._config["vpc_cidr"],
+            self._config["enable_nat_gateway"],
+            self._config["availability_zones"],
+        )
+        
+        # VPC CIDR token, read once and reused by security group rules
+        self._vpc_cidr_block = self.vpc.vpc_cidr_block
+        
+        # Subnet selection for the private subnets, shared by every VPC Endpoint.
+        # With a NAT Gateway the private subnets are PRIVATE_WITH_EGRESS instead
+        # of PRIVATE_ISOLATED, so the selection must follow the VPC layout.
+        self._private_subnet_selection = ec2.SubnetSelection(subnet_type=self._private_subnet_type)
         
         # Create VPC Gateway Endpoints (FREE)
         # Gateway Endpoints for S3 and DynamoDB are FREE and provide secure access
         # from private subnets without requiring NAT Gateway or internet access
-        self.s3_gateway_endpoint = self._create_s3_gateway_endpoint()
-        self.dynamodb_gateway_endpoint = self._create_dynamodb_gateway_endpoint()
-        
-        # Create security group for VPC Interface Endpoints
-        # Interface Endpoints require security group to control access
-        self.vpc_endpoint_security_group = self._create_vpc_endpoint_security_group()
-        
-        # Create VPC Interface Endpoints (~$7/month each)
-        # Interface Endpoints use ENIs with private IPs to route traffic to AWS services
-        # More expensive than Gateway Endpoints but still cheaper than NAT Gateway
-        self.cloudwatch_logs_endpoint = self._create_cloudwatch_logs_endpoint()
-        self.cloudwatch_monitoring_endpoint = self._create_cloudwatch_monitoring_endpoint()
-        self.systems_manager_endpoint = self._create_systems_manager_endpoint()
+        self.gateway_endpoints = self._create_gateway_endpoints()
+        self.s3_gateway_endpoint = self.gateway_endpoints["S3GatewayEndpoint"]
+        self.dynamodb_gateway_endpoint = self.gateway_endpoints["DynamoDBGatewayEndpoint"]
+        
+        # Interface Endpoints only replace the NAT Gateway path. When a NAT
+        # Gateway is enabled they would duplicate it (~$21/month), so the
+        # security group and Interface Endpoints are skipped entirely. They
+        # can also be switched off per stage with enable_interface_endpoints.
+        self.vpc_endpoint_security_group: Optional[ec2.SecurityGroup] = None
+        self.interface_endpoints: Dict[str, ec2.InterfaceVpcEndpoint] = {}
+        if self._config["enable_interface_endpoints"] and not self._config["enable_nat_gateway"]:
+            # Create security group for VPC Interface Endpoints
+            # Interface Endpoints require security group to control access
+            self.vpc_endpoint_security_group = self._create_vpc_endpoint_security_group()
+            
+            # Create VPC Interface Endpoints (~$7/month each)
+            # Interface Endpoints use ENIs with private IPs to route traffic to AWS services
+            # More expensive than Gateway Endpoints but still cheaper than NAT Gateway
+            self.interface_endpoints = self._create_interface_endpoints()
+        self.cloudwatch_logs_endpoint = self.interface_endpoints.get("CloudWatchLogsEndpoint")
+        self.cloudwatch_monitoring_endpoint = self.interface_endpoints.get("CloudWatchMonitoringEndpoint")
+        self.systems_manager_endpoint = self.interface_endpoints.get("SystemsManagerEndpoint")
         
         # Export VPC ID and subnet IDs for cross-stack references
         self._create_outputs()
     
-    def _create_vpc(self, vpc_cidr: str, enable_nat_gateway: bool) -> ec2.Vpc:
+    def _create_vpc(
+        self,
+        vpc_cidr: str,
+        enable_nat_gateway: bool,
+        availability_zones: Optional[List[str]] = None
+    ) -> ec2.Vpc:
         """
         Create VPC with multi-AZ subnets and configure route tables.
         
@@ -163,229 +256,97 @@ class ShowCoreNetworkStack(ShowCoreBaseStack):
         - Internet Gateway for public subnets
         - NO NAT Gateway (cost optimization)
         
-        Route Table Configuration (Automatic by CDK):
-        ================================================
-        
-        PUBLIC SUBNET ROUTE TABLES:
-        - CDK automatically creates route table for public subnets
-        - Route: 0.0.0.0/0 → Internet Gateway (automatic)
-        - Enables internet access for resources in public subnets
-        - Used for future Application Load Balancers
-        
-        PRIVATE SUBNET ROUTE TABLES:
-        - CDK automatically creates route table for private subnets
-        - NO default route (0.0.0.0/0) - NO internet access
-        - PRIVATE_ISOLATED subnet type ensures no NAT Gateway route
-        - Only local VPC routes (10.0.0.0/16) are present initially
-        
-        VPC ENDPOINT ROUTES (Added Automatically):
-        - Gateway Endpoints (S3, DynamoDB) automatically add routes to private route tables
-        - Route format: pl-xxxxx (prefix list) → vpce-xxxxx (Gateway Endpoint)
-        - S3 Gateway Endpoint: pl-63a5400a → vpce-s3-gateway-id
-        - DynamoDB Gateway Endpoint: pl-02cd2c6b → vpce-dynamodb-gateway-id
-        - These routes enable AWS service access without internet connectivity
-        
-        VERIFICATION:
-        - Private subnets have NO internet access (no 0.0.0.0/0 route)
-        - Private subnets can access S3 and DynamoDB via Gateway Endpoints (FREE)
-        - Private subnets can access CloudWatch and Systems Manager via Interface Endpoints
-        - Public subnets have internet access via Internet Gateway
+        CDK configures the route tables automatically; see
+        NETWORK_ROUTE_TABLES.md for the resulting routes.
+        
+        When availability_zones is given the VPC is pinned to those zones
+        instead of using max_azs=2, so synth does not depend on an
+        availability zone lookup for the target account and region.
         
         Args:
             vpc_cidr: CIDR block for VPC (e.g., "10.0.0.0/16")
             enable_nat_gateway: Whether to create NAT Gateway (should be False)
+            availability_zones: Optional explicit availability zones
             
         Returns:
             VPC construct
             
         Validates: Requirements 2.11, 2.4
         """
+        # Derive NAT-dependent settings once
+        # NO NAT Gateway for cost optimization; private subnets are PRIVATE_ISOLATED
+        nat_gateways = 1 if enable_nat_gateway else 0
+        
+        # Explicit zones from context, otherwise the first 2 zones of the region
+        if isinstance(availability_zones, str):
+            availability_zones = [az.strip() for az in availability_zones.split(",")]
+        az_props = (
+            {"availability_zones": list(availability_zones)}
+            if availability_zones
+            else {"max_azs": 2}  # Use 2 availability zones (us-east-1a, us-east-1b)
+        )
+        
         # Create VPC with explicit subnet configuration
         # Use construct ID "VPC" as specified in task requirements
-        # 
-        # ROUTE TABLE CONFIGURATION (Automatic by CDK):
-        # ==============================================
-        # 
-        # CDK automatically creates and configures route tables for each subnet type:
-        # 
-        # 1. PUBLIC SUBNET ROUTE TABLES:
-        #    - CDK creates one route table per public subnet
-        #    - Automatically adds route: 0.0.0.0/0 → Internet Gateway
-        #    - Enables internet access for resources in public subnets
-        #    - Used for future Application Load Balancers
-        # 
-        # 2. PRIVATE SUBNET ROUTE TABLES:
-        #    - CDK creates one route table per private subnet
-        #    - NO default route (0.0.0.0/0) - NO internet access
-        #    - PRIVATE_ISOLATED type ensures no NAT Gateway route is added
-        #    - Only local VPC routes (10.0.0.0/16) are present initially
-        #    - Gateway Endpoints will automatically add routes to these tables
-        # 
-        # 3. VPC ENDPOINT ROUTES (Added by Gateway Endpoints):
-        #    - S3 Gateway Endpoint automatically adds route to private route tables
-        #    - DynamoDB Gateway Endpoint automatically adds route to private route tables
-        #    - Route format: pl-xxxxx (prefix list) → vpce-xxxxx (Gateway Endpoint)
-        #    - These routes enable AWS service access without internet connectivity
-        # 
-        # VERIFICATION:
-        # - Private subnets have NO internet access (no 0.0.0.0/0 route to NAT Gateway or IGW)
-        # - Private subnets can access S3 and DynamoDB via Gateway Endpoints (FREE)
-        # - Private subnets can access CloudWatch and Systems Manager via Interface Endpoints
-        # - Public subnets have internet access via Internet Gateway
-        # 
+        # CDK creates one route table per subnet (see NETWORK_ROUTE_TABLES.md)
         vpc = ec2.Vpc(
             self,
             "VPC",
+            # Name tag for easier identification in console
+            vpc_name=self.get_resource_name("vpc"),
             ip_addresses=ec2.IpAddresses.cidr(vpc_cidr),
-            max_azs=2,  # Use 2 availability zones (us-east-1a, us-east-1b)
-            nat_gateways=0 if not enable_nat_gateway else 1,  # NO NAT Gateway for cost optimization
-            subnet_configuration=[
-                # Public subnets (10.0.0.0/24, 10.0.1.0/24)
-                # Route table: 0.0.0.0/0 → Internet Gateway (automatic)
-                ec2.SubnetConfiguration(
-                    name="Public",
-                    subnet_type=ec2.SubnetType.PUBLIC,
-                    cidr_mask=24,  # 256 IPs per subnet
-                ),
-                # Private subnets (10.0.2.0/24, 10.0.3.0/24)
-                # Route table: NO default route (PRIVATE_ISOLATED ensures no internet access)
-                # Gateway Endpoints will automatically add routes to these route tables
-                # NO NAT Gateway route - will use VPC Endpoints for AWS service access
-                ec2.SubnetConfiguration(
-                    name="Private",
-                    subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS if enable_nat_gateway else ec2.SubnetType.PRIVATE_ISOLATED,
-                    cidr_mask=24,  # 256 IPs per subnet
-                ),
-            ],
+            nat_gateways=nat_gateways,
+            # Public + private subnet configurations shared across stack instances
+            subnet_configuration=list(_subnet_configurations(enable_nat_gateway)),
             # Enable DNS hostnames and DNS support for VPC Endpoints
             enable_dns_hostnames=True,
             enable_dns_support=True,
+            **az_props,
         )
         
-        # Add Name tag to VPC for easier identification in console
-        vpc.node.add_metadata("Name", self.get_resource_name("vpc"))
-        
-        # ============================================================================
-        # ROUTE TABLE CONFIGURATION VERIFICATION
-        # ============================================================================
-        # 
-        # At this point, CDK has automatically configured the following route tables:
-        # 
-        # PUBLIC SUBNET ROUTE TABLES (2 route tables, one per AZ):
-        # ┌─────────────────────────────────────────────────────────────────┐
-        # │ Destination          │ Target                                   │
-        # ├─────────────────────────────────────────────────────────────────┤
-        # │ 10.0.0.0/16          │ local (VPC CIDR)                         │
-        # │ 0.0.0.0/0            │ igw-xxxxx (Internet Gateway)             │
-        # └─────────────────────────────────────────────────────────────────┘
-        # 
-        # PRIVATE SUBNET ROUTE TABLES (2 route tables, one per AZ):
-        # ┌─────────────────────────────────────────────────────────────────┐
-        # │ Destination          │ Target                                   │
-        # ├─────────────────────────────────────────────────────────────────┤
-        # │ 10.0.0.0/16          │ local (VPC CIDR)                         │
-        # │ NO DEFAULT ROUTE     │ NO NAT Gateway or Internet Gateway       │
-        # └─────────────────────────────────────────────────────────────────┘
-        # 
-        # AFTER GATEWAY ENDPOINTS ARE CREATED (in subsequent methods):
-        # Private subnet route tables will automatically have these routes added:
-        # ┌─────────────────────────────────────────────────────────────────┐
-        # │ Destination          │ Target                                   │
-        # ├─────────────────────────────────────────────────────────────────┤
-        # │ 10.0.0.0/16          │ local (VPC CIDR)                         │
-        # │ pl-63a5400a          │ vpce-xxxxx (S3 Gateway Endpoint)         │
-        # │ pl-02cd2c6b          │ vpce-xxxxx (DynamoDB Gateway Endpoint)   │
-        # └─────────────────────────────────────────────────────────────────┘
-        # 
-        # VERIFICATION CHECKLIST:
-        # ✅ Public subnets have route to Internet Gateway (0.0.0.0/0 → IGW)
-        # ✅ Private subnets have NO default route (no 0.0.0.0/0 route)
-        # ✅ Private subnets have NO NAT Gateway route (cost optimization)
-        # ✅ Gateway Endpoints will automatically add routes to private route tables
-        # ✅ Private subnets have NO internet access (PRIVATE_ISOLATED type)
-        # ✅ VPC ID and subnet IDs will be exported as CloudFormation outputs
-        # 
-        # This configuration validates Requirements 2.11 and 2.4:
-        # - Requirement 2.11: Route tables configured to route AWS service traffic through VPC Endpoints
-        # - Requirement 2.4: NO NAT Gateway deployed to eliminate ~$32/month cost
-        # ============================================================================
-        
         return vpc
     
-    def _create_s3_gateway_endpoint(self) -> ec2.GatewayVpcEndpoint:
-        """
-        Create S3 Gateway Endpoint for secure S3 access from private subnets.
-        
-        Gateway Endpoints are FREE and automatically add routes to private subnet
-        route tables. This enables private subnets to access S3 without requiring
-        NAT Gateway or internet access.
-        
-        Route Table Configuration:
-        - Gateway Endpoint automatically adds route to private subnet route tables
-        - Route format: pl-63a5400a (S3 prefix list) → vpce-xxxxx (Gateway Endpoint)
-        - NO manual route configuration required
-        - Private subnets can access S3 without internet access
-        
-        Use cases:
-        - RDS backups to S3
-        - Application logs to S3
-        - Static asset storage
-        - CloudTrail logs to S3
-        
-        Cost: FREE (no charges for Gateway Endpoints)
-        
-        Returns:
-            S3 Gateway Endpoint construct
-        """
-        s3_endpoint = ec2.GatewayVpcEndpoint(
-            self,
-            "S3GatewayEndpoint",
-            vpc=self.vpc,
-            service=ec2.GatewayVpcEndpointAwsService.S3,
-            # Attach to private subnet route tables automatically
-            # CDK automatically adds routes to the specified subnet route tables
-            # Route: S3 prefix list → Gateway Endpoint (automatic)
-            subnets=[ec2.SubnetSelection(subnet_type=ec2.SubnetType.PRIVATE_ISOLATED)]
-        )
-        
-        return s3_endpoint
-    
-    def _create_dynamodb_gateway_endpoint(self) -> ec2.GatewayVpcEndpoint:
+    def _create_gateway_endpoints(self) -> Dict[str, ec2.GatewayVpcEndpoint]:
         """
-        Create DynamoDB Gateway Endpoint for future use.
+        Create Gateway Endpoints for secure S3 and DynamoDB access from private subnets.
         
         Gateway Endpoints are FREE and automatically add routes to private subnet
-        route tables. This enables private subnets to access DynamoDB without
+        route tables. This enables private subnets to access S3 and DynamoDB without
         requiring NAT Gateway or internet access.
         
+        Endpoints are created from GATEWAY_ENDPOINTS, so adding a service only
+        requires a new (construct ID, service) entry.
+        
         Route Table Configuration:
         - Gateway Endpoint automatically adds route to private subnet route tables
-        - Route format: pl-02cd2c6b (DynamoDB prefix list) → vpce-xxxxx (Gateway Endpoint)
+        - Route format: pl-xxxxx (service prefix list) → vpce-xxxxx (Gateway Endpoint)
+          - S3: pl-63a5400a
+          - DynamoDB: pl-02cd2c6b
         - NO manual route configuration required
-        - Private subnets can access DynamoDB without internet access
+        - Private subnets can access S3 and DynamoDB without internet access
         
         Use cases:
-        - Future application data storage
-        - Session management
-        - Caching layer
+        - S3: RDS backups, application logs, static assets, CloudTrail logs
+        - DynamoDB: future application data storage, session management, caching layer
         
         Cost: FREE (no charges for Gateway Endpoints)
         
         Returns:
-            DynamoDB Gateway Endpoint construct
+            Gateway Endpoint constructs keyed by construct ID
         """
-        dynamodb_endpoint = ec2.GatewayVpcEndpoint(
-            self,
-            "DynamoDBGatewayEndpoint",
-            vpc=self.vpc,
-            service=ec2.GatewayVpcEndpointAwsService.DYNAMODB,
-            # Attach to private subnet route tables automatically
-            # CDK automatically adds routes to the specified subnet route tables
-            # Route: DynamoDB prefix list → Gateway Endpoint (automatic)
-            subnets=[ec2.SubnetSelection(subnet_type=ec2.SubnetType.PRIVATE_ISOLATED)]
-        )
-        
-        return dynamodb_endpoint
+        return {
+            endpoint_id: ec2.GatewayVpcEndpoint(
+                self,
+                endpoint_id,
+                vpc=self.vpc,
+                service=service,
+                # Attach to private subnet route tables automatically
+                # CDK automatically adds routes to the specified subnet route tables
+                # Route: service prefix list → Gateway Endpoint (automatic)
+                subnets=[self._private_subnet_selection]
+            )
+            for endpoint_id, service in self.GATEWAY_ENDPOINTS
+        }
     
     def _create_vpc_endpoint_security_group(self) -> ec2.SecurityGroup:
         """
@@ -417,128 +378,99 @@ class ShowCoreNetworkStack(ShowCoreBaseStack):
         # Allow HTTPS (443) from VPC CIDR
         # This allows all resources in the VPC to access AWS services via Interface Endpoints
         vpc_endpoint_sg.add_ingress_rule(
-            peer=ec2.Peer.ipv4(self.vpc.vpc_cidr_block),
-            connection=ec2.Port.tcp(443),
+            peer=ec2.Peer.ipv4(self._vpc_cidr_block),
+            connection=HTTPS_PORT,
             description="HTTPS from VPC for AWS service access"
         )
         
         return vpc_endpoint_sg
     
-    def _create_cloudwatch_logs_endpoint(self) -> ec2.InterfaceVpcEndpoint:
+    def _create_interface_endpoints(self) -> Dict[str, ec2.InterfaceVpcEndpoint]:
         """
-        Create CloudWatch Logs Interface Endpoint.
-        
-        Enables private subnets to send logs to CloudWatch Logs without internet access.
-        Uses Elastic Network Interfaces (ENIs) with private IPs in both private subnets.
-        
-        Use cases:
-        - RDS logs to CloudWatch
-        - ElastiCache logs to CloudWatch
-        - Future application logs
-        - VPC Flow Logs (if enabled)
-        
-        Cost: ~$7/month + data processing charges
+        Create the essential Interface Endpoints listed in INTERFACE_ENDPOINTS.
+        
+        Interface Endpoints use Elastic Network Interfaces (ENIs) with private IPs
+        in both private subnets, so private subnets reach these services without
+        internet access:
+        - CloudWatch Logs: RDS/ElastiCache logs, application logs, VPC Flow Logs (if enabled)
+        - CloudWatch Monitoring: RDS/ElastiCache metrics, custom metrics, alarms
+        - Systems Manager: Session Manager access without SSH keys, open port 22,
+          or bastion hosts; all sessions are logged and IAM-controlled
+        
+        Private DNS is enabled so applications use the standard service endpoints
+        (e.g. logs.us-east-1.amazonaws.com). Setting the disable_private_dns
+        context value skips the private hosted zones, which shortens endpoint
+        create/delete times; each endpoint's DNS name is then emitted as a
+        <EndpointId>DnsName output for services to pass as their SDK endpoint URL
+        (e.g. AWS_ENDPOINT_URL_CLOUDWATCH_LOGS=https://<dns name>).
+        
+        Cost: ~$7/month each + data processing charges
         - $0.01 per GB data processed
         - $0.01 per hour per AZ (~$7.20/month for 2 AZs)
         
         Returns:
-            CloudWatch Logs Interface Endpoint construct
+            Interface Endpoint constructs keyed by construct ID
         """
-        cloudwatch_logs_endpoint = ec2.InterfaceVpcEndpoint(
-            self,
-            "CloudWatchLogsEndpoint",
-            vpc=self.vpc,
-            service=ec2.InterfaceVpcEndpointAwsService.CLOUDWATCH_LOGS,
-            # Deploy ENI in both private subnets (us-east-1a, us-east-1b)
-            subnets=ec2.SubnetSelection(subnet_type=ec2.SubnetType.PRIVATE_ISOLATED),
-            # Attach security group to allow HTTPS from VPC
-            security_groups=[self.vpc_endpoint_security_group],
-            # Enable private DNS to use standard CloudWatch Logs endpoints
-            # This allows applications to use logs.us-east-1.amazonaws.com
-            private_dns_enabled=True,
-        )
-        
-        return cloudwatch_logs_endpoint
+        return self.add_interface_endpoints(self.INTERFACE_ENDPOINTS)
     
-    def _create_cloudwatch_monitoring_endpoint(self) -> ec2.InterfaceVpcEndpoint:
-        """
-        Create CloudWatch Monitoring Interface Endpoint.
-        
-        Enables private subnets to send metrics and alarms to CloudWatch without
-        internet access. Uses Elastic Network Interfaces (ENIs) with private IPs
-        in both private subnets.
-        
-        Use cases:
-        - RDS metrics to CloudWatch
-        - ElastiCache metrics to CloudWatch
-        - Custom application metrics
-        - CloudWatch alarms
-        
-        Cost: ~$7/month + data processing charges
-        - $0.01 per GB data processed
-        - $0.01 per hour per AZ (~$7.20/month for 2 AZs)
-        
-        Returns:
-            CloudWatch Monitoring Interface Endpoint construct
+    def add_interface_endpoints(
+        self,
+        endpoints: Iterable[Tuple[str, ec2.InterfaceVpcEndpointAwsService]]
+    ) -> Dict[str, ec2.InterfaceVpcEndpoint]:
         """
-        cloudwatch_monitoring_endpoint = ec2.InterfaceVpcEndpoint(
-            self,
-            "CloudWatchMonitoringEndpoint",
-            vpc=self.vpc,
-            service=ec2.InterfaceVpcEndpointAwsService.CLOUDWATCH_MONITORING,
-            # Deploy ENI in both private subnets (us-east-1a, us-east-1b)
-            subnets=ec2.SubnetSelection(subnet_type=ec2.SubnetType.PRIVATE_ISOLATED),
-            # Attach security group to allow HTTPS from VPC
-            security_groups=[self.vpc_endpoint_security_group],
-            # Enable private DNS to use standard CloudWatch endpoints
-            # This allows applications to use monitoring.us-east-1.amazonaws.com
-            private_dns_enabled=True,
-        )
+        Add a batch of Interface Endpoints to the private subnets.
         
-        return cloudwatch_monitoring_endpoint
-    
-    def _create_systems_manager_endpoint(self) -> ec2.InterfaceVpcEndpoint:
-        """
-        Create Systems Manager Interface Endpoint.
+        All endpoints share the VPC Endpoint security group and the private
+        subnet selection, so adding services never allocates another security
+        group or subnet selection.
         
-        Enables Session Manager for secure instance access without SSH keys or
-        bastion hosts. Uses Elastic Network Interfaces (ENIs) with private IPs
-        in both private subnets.
+        Usage:
+            network_stack.add_interface_endpoints([
+                ("SecretsManagerEndpoint", ec2.InterfaceVpcEndpointAwsService.SECRETS_MANAGER),
+            ])
         
-        Use cases:
-        - Session Manager access to EC2 instances
-        - Secure shell access without SSH keys
-        - No bastion hosts required
-        - Audit logging of all sessions
-        
-        Security Benefits:
-        - No SSH keys to manage
-        - No open SSH ports (22)
-        - All sessions logged to CloudWatch
-        - IAM-based access control
-        
-        Cost: ~$7/month + data processing charges
-        - $0.01 per GB data processed
-        - $0.01 per hour per AZ (~$7.20/month for 2 AZs)
+        Cost: ~$7/month per endpoint + data processing charges
         
+        Args:
+            endpoints: (construct ID, service) pairs to create
+            
         Returns:
-            Systems Manager Interface Endpoint construct
+            Interface Endpoint constructs keyed by construct ID
         """
-        systems_manager_endpoint = ec2.InterfaceVpcEndpoint(
-            self,
-            "SystemsManagerEndpoint",
-            vpc=self.vpc,
-            service=ec2.InterfaceVpcEndpointAwsService.SSM,
-            # Deploy ENI in both private subnets (us-east-1a, us-east-1b)
-            subnets=ec2.SubnetSelection(subnet_type=ec2.SubnetType.PRIVATE_ISOLATED),
-            # Attach security group to allow HTTPS from VPC
-            security_groups=[self.vpc_endpoint_security_group],
-            # Enable private DNS to use standard Systems Manager endpoints
-            # This allows applications to use ssm.us-east-1.amazonaws.com
-            private_dns_enabled=True,
-        )
-        
-        return systems_manager_endpoint
+        # In NAT mode the security group is skipped until an endpoint asks for it
+        if self.vpc_endpoint_security_group is None:
+            self.vpc_endpoint_security_group = self._create_vpc_endpoint_security_group()
+        
+        private_dns_enabled = not self._config["disable_private_dns"]
+        
+        interface_endpoints = {}
+        for endpoint_id, service in endpoints:
+            interface_endpoints[endpoint_id] = ec2.InterfaceVpcEndpoint(
+                self,
+                endpoint_id,
+                vpc=self.vpc,
+                service=service,
+                # Deploy ENI in both private subnets (us-east-1a, us-east-1b)
+                subnets=self._private_subnet_selection,
+                # Attach security group to allow HTTPS from VPC
+                security_groups=[self.vpc_endpoint_security_group],
+                # Enable private DNS so applications use standard service endpoints
+                private_dns_enabled=private_dns_enabled,
+            )
+            
+            # Without private DNS, clients must target the vpce-* DNS name directly
+            if not private_dns_enabled:
+                CfnOutput(
+                    self,
+                    f"{endpoint_id}DnsName",
+                    # DNS entries have the form "<hosted zone ID>:<DNS name>"
+                    value=Fn.select(1, Fn.split(
+                        ":", Fn.select(0, interface_endpoints[endpoint_id].vpc_endpoint_dns_entries)
+                    )),
+                    description=f"DNS name of {endpoint_id} for SDK endpoint overrides"
+                )
+        
+        return interface_endpoints
     
     def _create_outputs(self) -> None:
         """
@@ -549,64 +481,169 @@ class ShowCoreNetworkStack(ShowCoreBaseStack):
         Note: Private subnets are created with PRIVATE_ISOLATED type, which means
         they are accessible via vpc.isolated_subnets property in CDK.
         
+        Subnet ID lists are joined with Fn::Join so CloudFormation builds the
+        comma-separated value at deploy time instead of CDK concatenating tokens.
+        
         Exports:
         - VpcId: VPC ID
         - PublicSubnetIds: Comma-separated list of public subnet IDs
         - PrivateSubnetIds: Comma-separated list of private (isolated) subnet IDs
         
+        SSM Parameter:
+        - /showcore/<environment>/network: VPC ID followed by the public and
+          private subnet IDs, comma-separated
+        
         Validates: Requirements 2.11 (cross-stack references for route tables)
         """
-        # Export VPC ID
-        CfnOutput(
-            self,
-            "VpcId",
-            value=self.vpc.vpc_id,
-            export_name="ShowCoreVpcId",
-            description="VPC ID for ShowCore Phase 1"
+        # Note: private_subnet_ids come from isolated_subnets because we created subnets
+        # with PRIVATE_ISOLATED type - private subnets with NO internet access
+        outputs = (
+            # (output ID, value, description)
+            ("VpcId", self.vpc.vpc_id, "VPC ID for ShowCore Phase 1"),
+            ("PublicSubnetIds", Fn.join(",", list(self.public_subnet_ids)), "Public subnet IDs for ShowCore Phase 1"),
+            ("PrivateSubnetIds", Fn.join(",", list(self.private_subnet_ids)), "Private subnet IDs for ShowCore Phase 1"),
         )
         
-        # Export public subnet IDs
-        public_subnet_ids = [subnet.subnet_id for subnet in self.vpc.public_subnets]
-        CfnOutput(
-            self,
-            "PublicSubnetIds",
-            value=",".join(public_subnet_ids),
-            export_name="ShowCorePublicSubnetIds",
-            description="Public subnet IDs for ShowCore Phase 1"
+        # Export each output under the same name as its output ID
+        for output_id, value, description in outputs:
+            CfnOutput(
+                self,
+                output_id,
+                value=value,
+                export_name=self.get_export_name(output_id),
+                description=description
+            )
+        
+        # Publish the VPC ID and each subnet group as its own SSM parameter under
+        # /showcore/<env>/network/ so the groups stay separate, while consumers
+        # can still resolve the whole network layout with one GetParametersByPath
+        parameters = (
+            # (construct ID, parameter name, value, description)
+            ("VpcIdParameter", "vpc-id", self.vpc.vpc_id, "VPC ID for ShowCore Phase 1"),
+            ("PublicSubnetIdsParameter", "public-subnet-ids", Fn.join(",", list(self.public_subnet_ids)), "Public subnet IDs for ShowCore Phase 1"),
+            ("PrivateSubnetIdsParameter", "private-subnet-ids", Fn.join(",", list(self.private_subnet_ids)), "Private subnet IDs for ShowCore Phase 1"),
         )
         
-        # Export private subnet IDs
-        # Note: Using isolated_subnets because we created subnets with PRIVATE_ISOLATED type
-        # These are the private subnets with NO internet access (no NAT Gateway route)
-        private_subnet_ids = [subnet.subnet_id for subnet in self.vpc.isolated_subnets]
-        CfnOutput(
-            self,
-            "PrivateSubnetIds",
-            value=",".join(private_subnet_ids),
-            export_name="ShowCorePrivateSubnetIds",
-            description="Private subnet IDs for ShowCore Phase 1"
+        self.network_parameters = {
+            name: ssm.StringParameter(
+                self,
+                construct_id,
+                parameter_name=f"/showcore/{self.env_name}/network/{name}",
+                string_value=value,
+                description=description,
+            )
+            for construct_id, name, value, description in parameters
+        }
+    
+    @classmethod
+    def import_existing(
+        cls,
+        scope: Construct,
+        construct_id: str,
+        *,
+        vpc_id: str,
+        public_subnet_ids: List[str],
+        private_subnet_ids: List[str],
+        availability_zones: Optional[List[str]] = None
+    ) -> ec2.IVpc:
+        """
+        Reference an already deployed ShowCore VPC without synthesizing the network stack.
+        
+        Consumer stacks can use this when the network stack is unchanged, e.g. in
+        CI with IDs taken from the VpcId/PublicSubnetIds/PrivateSubnetIds outputs
+        or the network SSM parameter. The returned VPC exposes public_subnets and
+        isolated_subnets like the VPC created by this stack.
+        
+        Usage:
+            vpc = ShowCoreNetworkStack.import_existing(
+                database_stack,
+                "ImportedVpc",
+                vpc_id="vpc-0123456789abcdef0",
+                public_subnet_ids=["subnet-aaa", "subnet-bbb"],
+                private_subnet_ids=["subnet-ccc", "subnet-ddd"],
+            )
+        
+        Args:
+            scope: Construct in the consumer stack to create the reference in
+            construct_id: Unique identifier for the imported VPC
+            vpc_id: Deployed VPC ID
+            public_subnet_ids: Deployed public subnet IDs, one per availability zone
+            private_subnet_ids: Deployed private (isolated) subnet IDs, one per availability zone
+            availability_zones: Availability zones of the subnets (default: first
+                zones of the consumer stack's region)
+            
+        Returns:
+            Imported VPC
+        """
+        if availability_zones is None:
+            availability_zones = Stack.of(scope).availability_zones[:len(public_subnet_ids)]
+        
+        return ec2.Vpc.from_vpc_attributes(
+            scope,
+            construct_id,
+            vpc_id=vpc_id,
+            availability_zones=list(availability_zones),
+            public_subnet_ids=list(public_subnet_ids),
+            isolated_subnet_ids=list(private_subnet_ids),
         )
     
-    @property
-    def public_subnets(self) -> List[ec2.ISubnet]:
+    @cached_property
+    def public_subnets(self) -> Tuple[ec2.ISubnet, ...]:
         """
         Get public subnets.
         
+        The VPC's subnets never change after construction, so the list is
+        read from the VPC once and cached as an immutable tuple.
+        
         Returns:
-            List of public subnets
+            Tuple of public subnets
         """
-        return self.vpc.public_subnets
+        return tuple(self.vpc.public_subnets)
     
-    @property
-    def private_subnets(self) -> List[ec2.ISubnet]:
+    @cached_property
+    def private_subnets(self) -> Tuple[ec2.ISubnet, ...]:
         """
         Get private subnets.
         
         Note: Returns isolated_subnets because we created subnets with PRIVATE_ISOLATED type.
         These are the private subnets with NO internet access (no NAT Gateway route).
+        When enable_nat_gateway is set they are PRIVATE_WITH_EGRESS subnets instead.
+        Cached as an immutable tuple like public_subnets.
         
         Returns:
-            List of private (isolated) subnets
+            Tuple of private (isolated) subnets
         """
-        return self.vpc.isolated_subnets
-
+        if self._config["enable_nat_gateway"]:
+            return tuple(self.vpc.private_subnets)
+        return tuple(self.vpc.isolated_subnets)
+    
+    @property
+    def _private_subnet_type(self) -> ec2.SubnetType:
+        """Subnet type of the private subnets, which depends on enable_nat_gateway."""
+        if self._config["enable_nat_gateway"]:
+            return ec2.SubnetType.PRIVATE_WITH_EGRESS
+        return ec2.SubnetType.PRIVATE_ISOLATED
+    
+    @cached_property
+    def public_subnet_ids(self) -> Tuple[str, ...]:
+        """
+        Get public subnet IDs.
+        
+        Derived once from the cached public_subnets tuple.
+        
+        Returns:
+            Tuple of public subnet ID tokens
+        """
+        return tuple(subnet.subnet_id for subnet in self.public_subnets)
+    
+    @cached_property
+    def private_subnet_ids(self) -> Tuple[str, ...]:
+        """
+        Get private (isolated) subnet IDs.
+        
+        Derived once from the cached private_subnets tuple.
+        
+        Returns:
+            Tuple of private subnet ID tokens
+        """
+        return tuple(subnet.subnet_id for subnet in self.private_subnets)
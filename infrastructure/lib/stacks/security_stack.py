@@ -5,10 +5,13 @@ This stack creates:
 - Security groups for data tier (RDS, ElastiCache, VPC Endpoints)
 - CloudTrail trail for audit logging across all regions
 - S3 bucket for CloudTrail logs with versioning and encryption
+- SQS queue notified of new CloudTrail log files
 - CloudTrail log file validation
 - AWS Config for continuous compliance monitoring
 - AWS Config rules for security compliance (rds-storage-encrypted, s3-bucket-public-read-prohibited)
 - IAM role for AWS Systems Manager Session Manager with CloudWatch Logs permissions
+- IAM role and instance profile for RDS connectivity test instances
+  (only with the create_test_support_role context value)
 
 Cost Optimization:
 - CloudTrail: First trail is free, additional trails $2/month
@@ -39,23 +42,47 @@ Security:
 
 Dependencies: ShowCoreNetworkStack (requires VPC)
 
+Deployment:
+- Once the network stack is deployed this stack can be updated without a
+  ChangeSet:
+  cdk deploy ShowCoreSecurityStack --method=direct --exclusively
+- Only the CloudTrail bucket (and, in production, the SQS queue) is retained.
+  The security groups, CloudTrail trail, IAM roles, instance profile, bucket
+  notification handler and SSM parameters are ordinary stack resources, so a
+  direct update still replaces any of them whose replacement-only properties
+  changed (run cdk diff first). Replacing a security group fails while other
+  stacks import its exported ID.
+
 Validates: Requirements 3.3, 4.3, 6.2, 6.3, 6.8, 2.12, 2.9
 """
 
 from aws_cdk import (
     RemovalPolicy,
     Duration,
+    Token,
     aws_s3 as s3,
     aws_cloudtrail as cloudtrail,
     aws_iam as iam,
     aws_ec2 as ec2,
     aws_config as config,
+    aws_s3_notifications as s3n,
+    aws_sqs as sqs,
+    aws_ssm as ssm,
     CfnOutput,
 )
 from constructs import Construct
 from .base_stack import ShowCoreBaseStack
 
 
+# CloudTrail bucket policy building blocks, shared by every stack instance
+CLOUDTRAIL_PRINCIPAL = iam.ServicePrincipal("cloudtrail.amazonaws.com")
+CLOUDTRAIL_WRITE_CONDITIONS = {
+    "StringEquals": {
+        "s3:x-amz-acl": "bucket-owner-full-control"
+    }
+}
+
+
 class ShowCoreSecurityStack(ShowCoreBaseStack):
     """
     Security infrastructure stack for ShowCore Phase 1.
@@ -159,6 +186,9 @@ class ShowCoreSecurityStack(ShowCoreBaseStack):
         # Create S3 bucket for CloudTrail logs
         self.cloudtrail_bucket = self._create_cloudtrail_bucket()
         
+        # Notify consumers of new CloudTrail log files via SQS instead of polling
+        self.cloudtrail_notifications_queue = self._create_cloudtrail_notifications_queue()
+        
         # Create CloudTrail trail
         self.trail = self._create_cloudtrail_trail()
         
@@ -184,15 +214,24 @@ class ShowCoreSecurityStack(ShowCoreBaseStack):
         # Create IAM role for Session Manager
         self.session_manager_role = self._create_session_manager_role()
         
+        # Create reusable IAM role and instance profile for RDS connectivity tests
+        # only where integration tests run (create_test_support_role context value)
+        self.rds_connectivity_test_role = (
+            self._create_rds_connectivity_test_role()
+            if self.node.try_get_context("create_test_support_role") in (True, "true")
+            else None
+        )
+        
         # Export security group IDs for cross-stack references
         self._create_security_group_outputs()
         
-        # Export CloudTrail bucket name and trail ARN
+        # Output CloudTrail bucket name and trail ARN
+        # Not exported: downstream stacks read the SSM parameters below, so no
+        # Fn::ImportValue ties their deploys to this stack
         CfnOutput(
             self,
             "CloudTrailBucketName",
             value=self.cloudtrail_bucket.bucket_name,
-            export_name="ShowCoreCloudTrailBucketName",
             description="S3 bucket name for CloudTrail logs"
         )
         
@@ -200,7 +239,24 @@ class ShowCoreSecurityStack(ShowCoreBaseStack):
             self,
             "CloudTrailArn",
             value=self.trail.trail_arn,
-            export_name="ShowCoreCloudTrailArn",
+            description="ARN of CloudTrail trail"
+        )
+        
+        # Publish CloudTrail bucket name and trail ARN to SSM Parameter Store
+        # Consumers use ssm.StringParameter.value_for_string_parameter(...)
+        self.cloudtrail_bucket_name_parameter = ssm.StringParameter(
+            self,
+            "CloudTrailBucketNameParameter",
+            parameter_name=f"/showcore/{self.env_name}/security/cloudtrail-bucket-name",
+            string_value=self.cloudtrail_bucket.bucket_name,
+            description="S3 bucket name for CloudTrail logs"
+        )
+        
+        self.cloudtrail_arn_parameter = ssm.StringParameter(
+            self,
+            "CloudTrailArnParameter",
+            parameter_name=f"/showcore/{self.env_name}/security/cloudtrail-arn",
+            string_value=self.trail.trail_arn,
             description="ARN of CloudTrail trail"
         )
         
@@ -222,6 +278,26 @@ class ShowCoreSecurityStack(ShowCoreBaseStack):
         #     description="Name of AWS Config configuration recorder"
         # )
     
+    @property
+    def is_primary_region(self) -> bool:
+        """
+        Whether this stack is deployed to the primary region.
+        
+        The primary region comes from the primary_region context value, then
+        the region context value app.py deploys to, then the stack's own
+        region, so a single-region deployment is always primary.
+        Environment-agnostic stacks are treated as primary.
+        
+        Returns:
+            True unless the stack has a concrete region other than the primary one
+        """
+        primary_region = (
+            self.node.try_get_context("primary_region")
+            or self.node.try_get_context("region")
+            or self.region
+        )
+        return Token.is_unresolved(self.region) or self.region == primary_region
+    
     def _create_rds_security_group(self) -> ec2.SecurityGroup:
         """
         Create security group for RDS PostgreSQL instance.
@@ -399,8 +475,16 @@ class ShowCoreSecurityStack(ShowCoreBaseStack):
         - Versioning enabled for log integrity
         - SSE-S3 encryption at rest (free, no KMS costs)
         - Block all public access
-        - Lifecycle policy to delete logs after 90 days (cost optimization)
+        - Single lifecycle rule that:
+          - deletes logs after 90 days (cost optimization)
+          - deletes noncurrent log versions 30 days after they are superseded
+          - aborts incomplete multipart uploads after 7 days
         - Bucket policy allows CloudTrail service to write logs
+        - Daily S3 Inventory of current log objects under inventory/
+        
+        Consumers:
+        - Read the daily inventory, or walk the AWSLogs/<account>/CloudTrail/<region>/YYYY/MM/DD/
+          prefixes with start_after=<last key>, instead of listing the whole bucket
         
         Cost Optimization:
         - SSE-S3 encryption is free (no KMS costs)
@@ -418,10 +502,16 @@ class ShowCoreSecurityStack(ShowCoreBaseStack):
             
         Validates: Requirements 6.5, 1.4, 9.9
         """
+        # S3 bucket names are global: copies of this stack in other regions get a
+        # region suffix, while the primary region keeps the deployed bucket name
+        bucket_name = f"showcore-cloudtrail-logs-{self.account}"
+        if not self.is_primary_region:
+            bucket_name = f"{bucket_name}-{self.region}"
+        
         bucket = s3.Bucket(
             self,
             "CloudTrailBucket",
-            bucket_name=f"showcore-cloudtrail-logs-{self.account}",
+            bucket_name=bucket_name,
             versioned=True,
             encryption=s3.BucketEncryption.S3_MANAGED,  # SSE-S3 (free)
             block_public_access=s3.BlockPublicAccess.BLOCK_ALL,
@@ -430,19 +520,28 @@ class ShowCoreSecurityStack(ShowCoreBaseStack):
                 s3.LifecycleRule(
                     id="DeleteOldLogs",
                     enabled=True,
-                    expiration=Duration.days(90)  # Delete logs after 90 days (cost optimization)
+                    expiration=Duration.days(90),  # Delete logs after 90 days (cost optimization)
+                    # Versioning keeps expired/overwritten logs as noncurrent versions;
+                    # remove them too so they don't accumulate indefinitely
+                    noncurrent_version_expiration=Duration.days(30),
+                    # Clean up orphaned parts left by operator tooling (billed until removed)
+                    abort_incomplete_multipart_upload_after=Duration.days(7)
                 )
             ]
         )
         
+        # Bucket ARN tokens, read once for both policy statements
+        bucket_arn = bucket.bucket_arn
+        bucket_objects_arn = f"{bucket_arn}/*"
+        
         # Add bucket policy to allow CloudTrail to write logs
         bucket.add_to_resource_policy(
             iam.PolicyStatement(
                 sid="AWSCloudTrailAclCheck",
                 effect=iam.Effect.ALLOW,
-                principals=[iam.ServicePrincipal("cloudtrail.amazonaws.com")],
+                principals=[CLOUDTRAIL_PRINCIPAL],
                 actions=["s3:GetBucketAcl"],
-                resources=[bucket.bucket_arn]
+                resources=[bucket_arn]
             )
         )
         
@@ -450,19 +549,100 @@ class ShowCoreSecurityStack(ShowCoreBaseStack):
             iam.PolicyStatement(
                 sid="AWSCloudTrailWrite",
                 effect=iam.Effect.ALLOW,
-                principals=[iam.ServicePrincipal("cloudtrail.amazonaws.com")],
+                principals=[CLOUDTRAIL_PRINCIPAL],
                 actions=["s3:PutObject"],
-                resources=[f"{bucket.bucket_arn}/*"],
+                resources=[bucket_objects_arn],
+                conditions=CLOUDTRAIL_WRITE_CONDITIONS
+            )
+        )
+        
+        # Daily inventory of current log objects so consumers (SIEM, Athena) can
+        # read the object list instead of paging through ListObjectsV2.
+        # The inventory is written to this same bucket, so the destination ARN is
+        # built from the literal bucket name: bucket.add_inventory() would render
+        # a GetAtt on the bucket inside its own properties (circular dependency)
+        bucket_name_arn = f"arn:{self.partition}:s3:::{bucket_name}"
+        
+        bucket.add_to_resource_policy(
+            iam.PolicyStatement(
+                sid="S3InventoryWrite",
+                effect=iam.Effect.ALLOW,
+                principals=[iam.ServicePrincipal("s3.amazonaws.com")],
+                actions=["s3:PutObject"],
+                resources=[f"{bucket_name_arn}/inventory/*"],
                 conditions={
-                    "StringEquals": {
-                        "s3:x-amz-acl": "bucket-owner-full-control"
-                    }
+                    "ArnLike": {"aws:SourceArn": bucket_name_arn},
+                    "StringEquals": {"aws:SourceAccount": self.account}
                 }
             )
         )
         
+        cfn_bucket: s3.CfnBucket = bucket.node.default_child
+        cfn_bucket.inventory_configurations = [
+            s3.CfnBucket.InventoryConfigurationProperty(
+                id="DailyCloudTrailLogInventory",
+                enabled=True,
+                included_object_versions="Current",
+                schedule_frequency="Daily",
+                destination=s3.CfnBucket.DestinationProperty(
+                    bucket_arn=bucket_name_arn,
+                    format="CSV",
+                    prefix="inventory"
+                )
+            )
+        ]
+        
         return bucket
     
+    def _create_cloudtrail_notifications_queue(self) -> sqs.Queue:
+        """
+        Create SQS queue notified of every new CloudTrail log file.
+        
+        Consumers (SIEM, log processors) receive up to 10 notifications per
+        ReceiveMessage call instead of repeatedly listing the bucket.
+        
+        Configuration:
+        - S3 OBJECT_CREATED notifications for AWSLogs/<account>/CloudTrail/*.json.gz
+          log files (digest files are excluded)
+        - SSE-SQS encryption (free, no KMS costs)
+        - 5 minute visibility timeout for batch processing
+        - Queue ARN published to SSM for consumers
+        
+        Cost: First 1 million SQS requests/month free, then $0.40/million
+        
+        Returns:
+            SQS Queue construct for CloudTrail log notifications
+        """
+        queue = sqs.Queue(
+            self,
+            "CloudTrailNotificationsQueue",
+            queue_name=self.get_resource_name("cloudtrail-notifications"),
+            encryption=sqs.QueueEncryption.SQS_MANAGED,  # SSE-SQS (free)
+            visibility_timeout=Duration.minutes(5),
+            removal_policy=self.removal_policy
+        )
+        
+        self.cloudtrail_bucket.add_event_notification(
+            s3.EventType.OBJECT_CREATED,
+            s3n.SqsDestination(queue),
+            # Log files only: CloudTrail-Digest/ files share the AWSLogs/<account>/
+            # prefix and .json.gz suffix but are not log batches
+            s3.NotificationKeyFilter(
+                prefix=f"AWSLogs/{self.account}/CloudTrail/",
+                suffix=".json.gz"
+            )
+        )
+        
+        ssm.StringParameter(
+            self,
+            "CloudTrailNotificationsQueueArnParameter",
+            parameter_name=f"/showcore/{self.env_name}/security/cloudtrail-notifications-queue-arn",
+            string_value=queue.queue_arn,
+            description="ARN of SQS queue notified of new CloudTrail log files"
+        )
+        
+        return queue
+    
     def _create_cloudtrail_trail(self) -> cloudtrail.Trail:
         """
         Create CloudTrail trail for audit logging.
@@ -474,18 +654,41 @@ class ShowCoreSecurityStack(ShowCoreBaseStack):
         - Logs stored in S3 bucket with encryption
         - First trail is free
         
+        Non-production environments log write management events only (about
+        half the log volume) unless cloudtrail_read_events is set.
+        
+        Copies of this stack outside the primary region create a single-region
+        trail without global service events, so IAM/STS/CloudFront events and
+        other regions' API calls are only logged once by the primary trail.
+        
         Returns:
             CloudTrail Trail construct
         """
+        # CloudTrail requires multi-region trails to include global service events,
+        # so both settings follow the primary region
+        is_primary_region = self.is_primary_region
+        
+        # Read-only API calls are roughly half of all management events. Production
+        # logs them for auditing; other environments only log writes unless the
+        # cloudtrail_read_events context value is set
+        log_read_events = self.node.try_get_context("cloudtrail_read_events")
+        if log_read_events is None:
+            log_read_events = self.env_name == "production"
+        management_events = (
+            cloudtrail.ReadWriteType.ALL
+            if log_read_events in (True, "true")
+            else cloudtrail.ReadWriteType.WRITE_ONLY
+        )
+        
         trail = cloudtrail.Trail(
             self,
             "CloudTrail",
             trail_name="showcore-audit-trail",
             bucket=self.cloudtrail_bucket,
-            is_multi_region_trail=True,  # Log API calls from all regions
-            include_global_service_events=True,  # Include IAM, STS, CloudFront
+            is_multi_region_trail=is_primary_region,  # Log API calls from all regions
+            include_global_service_events=is_primary_region,  # Include IAM, STS, CloudFront
             enable_file_validation=True,  # Enable log file validation
-            management_events=cloudtrail.ReadWriteType.ALL,  # Log all management events
+            management_events=management_events,  # All in production, write-only elsewhere
         )
         
         return trail
@@ -837,3 +1040,54 @@ class ShowCoreSecurityStack(ShowCoreBaseStack):
         )
         
         return session_manager_role
+
+    def _create_rds_connectivity_test_role(self) -> iam.Role:
+        """
+        Create IAM role and instance profile for RDS connectivity test instances.
+        
+        The RDS connectivity integration test launches a temporary EC2 instance
+        in a private subnet and drives it through Session Manager. Provisioning
+        the role once here lets the test look the instance profile up by name
+        instead of creating and deleting IAM resources on every run (and
+        waiting for IAM eventual consistency in between).
+        
+        Only created when the create_test_support_role context value is set,
+        so environments that don't run integration tests don't carry a
+        test-only EC2/SSM role.
+        
+        Configuration:
+        - IAM role assumed by EC2 with AmazonSSMManagedInstanceCore managed policy
+        - Instance profile with the same name as the role
+        - Named showcore-security-{environment}-rds-connectivity-test-role, so
+          several environments can share an account
+        
+        Cost:
+        - IAM role and instance profile: Free
+        
+        Returns:
+            IAM Role construct for RDS connectivity test instances
+        """
+        role_name = self.get_resource_name("rds-connectivity-test-role")
+        
+        rds_connectivity_test_role = iam.Role(
+            self,
+            "RdsConnectivityTestRole",
+            role_name=role_name,
+            assumed_by=iam.ServicePrincipal("ec2.amazonaws.com"),
+            description="IAM role for temporary RDS connectivity test instances (Session Manager access)",
+            managed_policies=[
+                iam.ManagedPolicy.from_aws_managed_policy_name(
+                    "AmazonSSMManagedInstanceCore"
+                )
+            ]
+        )
+        
+        # Instance profile looked up by name from tests/integration/conftest.py
+        iam.InstanceProfile(
+            self,
+            "RdsConnectivityTestInstanceProfile",
+            role=rds_connectivity_test_role,
+            instance_profile_name=role_name
+        )
+        
+        return rds_connectivity_test_role
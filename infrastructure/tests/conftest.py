@@ -0,0 +1,18 @@
+"""
+Pytest configuration shared by all ShowCore infrastructure tests.
+"""
+
+
+def pytest_addoption(parser):
+    """
+    Register ShowCore command line options.
+    
+    Args:
+        parser: pytest command line parser
+    """
+    parser.addoption(
+        '--run-aws-integration',
+        action='store_true',
+        default=False,
+        help='Provision temporary AWS resources (EC2 test instance) for integration tests'
+    )
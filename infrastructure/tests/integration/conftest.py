@@ -0,0 +1,587 @@
+"""
+Shared fixtures for ShowCore integration tests.
+
+These fixtures look up deployed ShowCore resources and provision the
+temporary EC2 test instance used by the RDS connectivity tests. They are
+session-scoped so any integration module can reuse them and the EC2
+setup is paid at most once per test run.
+"""
+
+import logging
+import os
+import pytest
+import boto3
+import time
+from typing import Dict, Any, Optional
+from botocore.config import Config
+from botocore.exceptions import ClientError, WaiterError
+from tests.utils import AWSResourceValidator
+
+
+logger = logging.getLogger(__name__)
+
+# Environment under test (the environment context value the stacks were deployed with)
+_ENVIRONMENT = os.environ.get('SHOWCORE_ENVIRONMENT', 'production')
+
+# Instance profile provisioned by ShowCoreSecurityStack for the test instance
+# (deployed with -c create_test_support_role=true)
+_TEST_INSTANCE_PROFILE_NAME = f'showcore-security-{_ENVIRONMENT}-rds-connectivity-test-role'
+
+# RDS instance identifier from DatabaseStack naming (showcore-database-{env}-rds);
+# override with SHOWCORE_RDS_INSTANCE_ID if the instance was renamed
+_RDS_INSTANCE_ID = os.environ.get('SHOWCORE_RDS_INSTANCE_ID', f'showcore-database-{_ENVIRONMENT}-rds')
+
+
+def _wait_for_user_data(
+    aws_validator: AWSResourceValidator,
+    instance_id: str,
+    timeout: int = 300,
+    interval: int = 5
+) -> bool:
+    """
+    Poll the test instance via SSM Run Command until user data has finished.
+    
+    Checks for the /tmp/user_data_complete sentinel written at the end of the
+    user data script, so the wait ends as soon as initialization completes.
+    
+    Args:
+        aws_validator: AWS resource validator
+        instance_id: Test instance ID
+        timeout: Maximum time to wait in seconds (default: 300)
+        interval: Delay between checks in seconds (default: 5)
+    
+    Returns:
+        True if user data completed, False if the timeout was reached
+    """
+    deadline = time.monotonic() + timeout
+    
+    while time.monotonic() < deadline:
+        try:
+            response = aws_validator.ssm.send_command(
+                InstanceIds=[instance_id],
+                DocumentName='AWS-RunShellScript',
+                Parameters={'commands': ['test -f /tmp/user_data_complete && echo READY']}
+            )
+            command_id = response['Command']['CommandId']
+            
+            # Wait for this command to finish on the instance; the deadline may
+            # pass before the first check, leaving no invocation to read
+            invocation = None
+            finished = False
+            while time.monotonic() < deadline:
+                time.sleep(interval)
+                invocation = aws_validator.ssm.get_command_invocation(
+                    CommandId=command_id,
+                    InstanceId=instance_id
+                )
+                if invocation['Status'] not in ('Pending', 'InProgress', 'Delayed'):
+                    finished = True
+                    break
+            
+            if finished and 'READY' in invocation.get('StandardOutputContent', ''):
+                return True
+        except ClientError as e:
+            # SSM agent not registered yet, or invocation not visible yet
+            if e.response['Error']['Code'] not in ('InvalidInstanceId', 'InvocationDoesNotExist'):
+                raise
+        
+        time.sleep(interval)
+    
+    return False
+
+
+def _latest_al2023_ami(aws_validator: AWSResourceValidator) -> Optional[str]:
+    """
+    Get the latest Amazon Linux 2023 x86_64 AMI ID.
+    
+    Resolves the AWS-published SSM public parameter (one small call) and
+    falls back to a server-side filtered describe_images if it is unavailable.
+    
+    Args:
+        aws_validator: AWS resource validator
+    
+    Returns:
+        AMI ID or None if no image is found
+    """
+    try:
+        return aws_validator.ssm.get_parameter(
+            Name='/aws/service/ami-amazon-linux-latest/al2023-ami-kernel-default-x86_64'
+        )['Parameter']['Value']
+    except ClientError:
+        pass
+    
+    response = aws_validator.ec2.describe_images(
+        Owners=['amazon'],
+        Filters=[
+            {'Name': 'name', 'Values': ['al2023-ami-2023*-kernel-*-x86_64']},
+            {'Name': 'owner-alias', 'Values': ['amazon']},
+            {'Name': 'state', 'Values': ['available']}
+        ]
+    )
+    
+    images = [
+        {'ImageId': image['ImageId'], 'CreationDate': image['CreationDate']}
+        for image in response.get('Images', [])
+    ]
+    if not images:
+        return None
+    
+    return max(images, key=lambda x: x['CreationDate'])['ImageId']
+
+
+def _prebaked_test_ami(aws_validator: AWSResourceValidator) -> Optional[str]:
+    """
+    Get the newest pre-baked RDS connectivity test AMI, if one exists.
+    
+    The AMI is Amazon Linux 2023 with the PostgreSQL 16 client installed,
+    tagged Project=ShowCore and Purpose=RDSConnectivityTest, so the test
+    instance skips package installation in user data.
+    
+    Args:
+        aws_validator: AWS resource validator
+    
+    Returns:
+        AMI ID or None if no pre-baked image is found
+    """
+    try:
+        response = aws_validator.ec2.describe_images(
+            Owners=['self'],
+            Filters=[
+                {'Name': 'tag:Purpose', 'Values': ['RDSConnectivityTest']},
+                {'Name': 'tag:Project', 'Values': ['ShowCore']},
+                {'Name': 'state', 'Values': ['available']}
+            ]
+        )
+    except ClientError:
+        return None
+    
+    images = response.get('Images', [])
+    if not images:
+        return None
+    
+    return max(images, key=lambda x: x['CreationDate'])['ImageId']
+
+
+@pytest.fixture(scope="session")
+def aws_validator():
+    """
+    Create AWS resource validator for integration tests.
+    
+    Session-scoped so every integration module shares the same clients and
+    connection pools. The botocore config sizes the pool for concurrent
+    calls, uses adaptive retries, and keeps idle connections alive.
+    
+    Returns:
+        AWSResourceValidator instance configured for us-east-1
+    """
+    return AWSResourceValidator(
+        region='us-east-1',
+        botocore_config=Config(
+            max_pool_connections=50,
+            retries={'mode': 'adaptive', 'max_attempts': 5},
+            tcp_keepalive=True,
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def vpc_info(aws_validator: AWSResourceValidator) -> Dict[str, Any]:
+    """
+    Get VPC information for ShowCore infrastructure.
+    
+    Args:
+        aws_validator: AWS resource validator
+    
+    Returns:
+        Dict with VPC ID and subnet information
+    
+    Raises:
+        pytest.skip: If VPC not found (infrastructure not deployed)
+    """
+    vpc = aws_validator.get_vpc_by_tag('Project', 'ShowCore')
+    if not vpc:
+        pytest.skip("ShowCore VPC not found - infrastructure not deployed")
+    
+    vpc_id = vpc['VpcId']
+    
+    # Get private subnets (PRIVATE_ISOLATED type)
+    response = aws_validator.ec2.describe_subnets(
+        Filters=[
+            {'Name': 'vpc-id', 'Values': [vpc_id]},
+            {'Name': 'tag:Component', 'Values': ['Network']},
+            {'Name': 'tag:Tier', 'Values': ['Private']}
+        ]
+    )
+    
+    private_subnets = response.get('Subnets', [])
+    if not private_subnets:
+        pytest.skip("Private subnets not found - infrastructure not deployed")
+    
+    return {
+        'vpc_id': vpc_id,
+        'private_subnet_id': private_subnets[0]['SubnetId'],
+        'availability_zone': private_subnets[0]['AvailabilityZone']
+    }
+
+
+@pytest.fixture(scope="session")
+def rds_instance_detail(aws_validator: AWSResourceValidator) -> Dict[str, Any]:
+    """
+    Get RDS instance details for ShowCore infrastructure.
+    
+    DescribeDBInstances is called once per session; tests read the cached
+    instance dict instead of re-querying RDS. The instance is looked up
+    directly by its known identifier, falling back to the ShowCore
+    Project tag if it was deployed under a different name.
+    
+    Args:
+        aws_validator: AWS resource validator
+    
+    Returns:
+        RDS DB instance dict as returned by DescribeDBInstances
+    
+    Raises:
+        pytest.skip: If RDS instance not found (infrastructure not deployed)
+    """
+    # Get RDS instance details by identifier (single DescribeDBInstances call)
+    db_identifier = _RDS_INSTANCE_ID
+    db_instance = aws_validator.get_rds_instance(db_identifier)
+    
+    if not db_instance:
+        # Fall back to RDS instance by tag
+        resources = aws_validator.get_resources_by_tag(
+            'Project',
+            'ShowCore',
+            resource_type_filters=['rds:db']
+        )
+        
+        if not resources:
+            pytest.skip("ShowCore RDS instance not found - infrastructure not deployed")
+        
+        # Extract DB instance identifier from ARN
+        # ARN format: arn:aws:rds:us-east-1:123456789012:db:showcore-database-production-rds
+        db_arn = resources[0]['ResourceARN']
+        db_identifier = db_arn.split(':')[-1]
+        
+        db_instance = aws_validator.get_rds_instance(db_identifier)
+        if not db_instance:
+            pytest.skip(f"RDS instance {db_identifier} not found")
+    
+    # Check if instance is available
+    if db_instance['DBInstanceStatus'] != 'available':
+        pytest.skip(f"RDS instance {db_identifier} is not available (status: {db_instance['DBInstanceStatus']})")
+    
+    return db_instance
+
+
+@pytest.fixture(scope="session")
+def rds_info(rds_instance_detail: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Get RDS instance information for ShowCore infrastructure.
+    
+    Args:
+        rds_instance_detail: RDS instance details
+    
+    Returns:
+        Dict with RDS endpoint, port, and database name
+    """
+    return {
+        'endpoint': rds_instance_detail['Endpoint']['Address'],
+        'port': rds_instance_detail['Endpoint']['Port'],
+        'database_name': rds_instance_detail['DBName'],
+        'db_identifier': rds_instance_detail['DBInstanceIdentifier'],
+        'security_group_ids': [sg['VpcSecurityGroupId'] for sg in rds_instance_detail['VpcSecurityGroups']]
+    }
+
+
+@pytest.fixture(scope="session")
+def rds_security_group(aws_validator: AWSResourceValidator, rds_info: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Get the RDS instance's primary security group.
+    
+    Args:
+        aws_validator: AWS resource validator
+        rds_info: RDS information
+    
+    Returns:
+        Security group dict as returned by DescribeSecurityGroups
+    """
+    response = aws_validator.ec2.describe_security_groups(GroupIds=[rds_info['security_group_ids'][0]])
+    return response['SecurityGroups'][0]
+
+
+@pytest.fixture(scope="session")
+def aws_provisioning(request: pytest.FixtureRequest) -> None:
+    """
+    Gate fixtures that create temporary AWS resources.
+    
+    Requested first by every fixture that provisions resources, so nothing
+    is created unless pytest is run with --run-aws-integration. Tests that
+    only read RDS metadata never request it.
+    
+    Args:
+        request: pytest fixture request (for the command line option)
+    
+    Raises:
+        pytest.skip: If --run-aws-integration was not given
+    """
+    if not request.config.getoption('--run-aws-integration'):
+        pytest.skip("Temporary AWS test resources not created - pass --run-aws-integration to enable")
+
+
+@pytest.fixture(scope="session")
+def security_group_info(
+    aws_provisioning: None,
+    aws_validator: AWSResourceValidator,
+    vpc_info: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Get security group information for test instance.
+    
+    Creates a temporary security group for the test instance that allows
+    outbound PostgreSQL connections to RDS.
+    
+    Args:
+        aws_provisioning: Gate for creating temporary AWS resources
+        aws_validator: AWS resource validator
+        vpc_info: VPC information
+    
+    Returns:
+        Dict with security group ID
+    
+    Yields:
+        Security group information
+    
+    Cleanup:
+        Deletes the temporary security group after tests complete
+    """
+    # Create temporary security group for test instance
+    sg_name = f"showcore-test-rds-connectivity-{int(time.time())}"
+    
+    try:
+        response = aws_validator.ec2.create_security_group(
+            GroupName=sg_name,
+            Description="Temporary security group for RDS connectivity test",
+            VpcId=vpc_info['vpc_id']
+        )
+        
+        sg_id = response['GroupId']
+        
+        # Add outbound rules in a single call:
+        # - PostgreSQL (5432) so the test instance can connect to RDS
+        # - HTTPS (443) to VPC Endpoints for Systems Manager and CloudWatch
+        # The default 0.0.0.0/0 egress rule is kept: dnf reaches the package
+        # repositories through the S3 gateway endpoint, whose prefix list is
+        # outside the VPC CIDR
+        aws_validator.ec2.authorize_security_group_egress(
+            GroupId=sg_id,
+            IpPermissions=[
+                {
+                    'IpProtocol': 'tcp',
+                    'FromPort': 5432,
+                    'ToPort': 5432,
+                    'IpRanges': [{'CidrIp': '10.0.0.0/16', 'Description': 'PostgreSQL to RDS'}]
+                },
+                {
+                    'IpProtocol': 'tcp',
+                    'FromPort': 443,
+                    'ToPort': 443,
+                    'IpRanges': [{'CidrIp': '10.0.0.0/16', 'Description': 'HTTPS to VPC Endpoints'}]
+                }
+            ]
+        )
+        
+        yield {'security_group_id': sg_id}
+        
+    finally:
+        # Cleanup: Delete security group
+        try:
+            aws_validator.ec2.delete_security_group(GroupId=sg_id)
+        except ClientError as e:
+            logger.warning("Failed to delete security group %s: %s", sg_id, e)
+
+
+@pytest.fixture(scope="session")
+def test_instance(
+    aws_provisioning: None,
+    aws_validator: AWSResourceValidator,
+    vpc_info: Dict[str, Any],
+    rds_info: Dict[str, Any],
+    security_group_info: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Deploy temporary EC2 instance in private subnet for RDS connectivity testing.
+    
+    The test instance:
+    - Runs the pre-baked ShowCore test AMI if one exists, otherwise
+      Amazon Linux 2023 (free tier eligible)
+    - Deployed in private subnet (same as RDS)
+    - Has PostgreSQL client (psql) baked in or installed via user data
+    - Uses Systems Manager Session Manager for access (no SSH keys)
+    - Automatically terminated after tests complete
+    
+    Only created when pytest is run with --run-aws-integration, so runs that
+    do not ask for it never pay the EC2 setup cost. The instance profile
+    (showcore-security-{env}-rds-connectivity-test-role) is created by
+    SecurityStack when deployed with -c create_test_support_role=true and
+    reused across runs.
+    
+    Args:
+        aws_provisioning: Gate for creating temporary AWS resources
+        aws_validator: AWS resource validator
+        vpc_info: VPC information
+        rds_info: RDS information
+        security_group_info: Security group information
+    
+    Returns:
+        Dict with instance ID and connection information
+    
+    Yields:
+        Test instance information
+    
+    Cleanup:
+        Terminates the test instance after tests complete
+    """
+    # Prefer the pre-baked test AMI (PostgreSQL client already installed),
+    # falling back to the latest Amazon Linux 2023 AMI
+    ami_id = _prebaked_test_ami(aws_validator)
+    install_commands = ""
+    if not ami_id:
+        ami_id = _latest_al2023_ami(aws_validator)
+        # SSM agent is pre-installed on Amazon Linux 2023; only psql is needed
+        install_commands = """# Install PostgreSQL 16 client
+dnf install -y postgresql16
+"""
+    if not ami_id:
+        pytest.skip("Amazon Linux 2023 AMI not found")
+    
+    # User data script to install PostgreSQL client (unless pre-baked)
+    user_data = f"""#!/bin/bash
+{install_commands}
+# Create test script for RDS connectivity
+cat > /home/ec2-user/test_rds_connection.sh << 'EOF'
+#!/bin/bash
+# Test RDS connectivity with SSL/TLS enforcement
+
+RDS_ENDPOINT="{rds_info['endpoint']}"
+RDS_PORT="{rds_info['port']}"
+RDS_DATABASE="{rds_info['database_name']}"
+
+echo "Testing RDS connectivity..."
+echo "Endpoint: $RDS_ENDPOINT"
+echo "Port: $RDS_PORT"
+echo "Database: $RDS_DATABASE"
+echo ""
+
+# Test 1: Connect with SSL mode=require (should succeed)
+echo "Test 1: Connecting with SSL mode=require..."
+PGPASSWORD="dummy" psql -h $RDS_ENDPOINT -p $RDS_PORT -U postgres -d $RDS_DATABASE -c "SELECT version();" sslmode=require 2>&1
+TEST1_RESULT=$?
+
+# Test 2: Connect with SSL mode=disable (should fail - SSL enforced)
+echo ""
+echo "Test 2: Connecting with SSL mode=disable (should fail)..."
+PGPASSWORD="dummy" psql -h $RDS_ENDPOINT -p $RDS_PORT -U postgres -d $RDS_DATABASE -c "SELECT version();" sslmode=disable 2>&1
+TEST2_RESULT=$?
+
+# Test 3: Check if connection uses SSL
+echo ""
+echo "Test 3: Verifying SSL connection..."
+PGPASSWORD="dummy" psql -h $RDS_ENDPOINT -p $RDS_PORT -U postgres -d $RDS_DATABASE -c "SHOW ssl;" sslmode=require 2>&1
+TEST3_RESULT=$?
+
+echo ""
+echo "Test Results:"
+echo "Test 1 (SSL required): Exit code $TEST1_RESULT"
+echo "Test 2 (SSL disabled): Exit code $TEST2_RESULT"
+echo "Test 3 (SSL verification): Exit code $TEST3_RESULT"
+EOF
+
+chmod +x /home/ec2-user/test_rds_connection.sh
+chown ec2-user:ec2-user /home/ec2-user/test_rds_connection.sh
+
+# Signal completion
+touch /tmp/user_data_complete
+"""
+    
+    # Session Manager instance profile is provisioned once by SecurityStack
+    iam_client = boto3.client('iam', region_name='us-east-1')
+    instance_profile_name = _TEST_INSTANCE_PROFILE_NAME
+    try:
+        iam_client.get_instance_profile(InstanceProfileName=instance_profile_name)
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'NoSuchEntity':
+            pytest.skip(
+                f"Instance profile {instance_profile_name} not found "
+                "(deploy ShowCoreSecurityStack with -c create_test_support_role=true)"
+            )
+        raise
+    
+    try:
+        # Launch EC2 instance
+        response = aws_validator.ec2.run_instances(
+            ImageId=ami_id,
+            InstanceType='t3.micro',
+            MinCount=1,
+            MaxCount=1,
+            SubnetId=vpc_info['private_subnet_id'],
+            SecurityGroupIds=[security_group_info['security_group_id']],
+            IamInstanceProfile={'Name': instance_profile_name},
+            UserData=user_data,
+            TagSpecifications=[
+                {
+                    'ResourceType': 'instance',
+                    'Tags': [
+                        {'Key': 'Name', 'Value': 'showcore-test-rds-connectivity'},
+                        {'Key': 'Project', 'Value': 'ShowCore'},
+                        {'Key': 'Purpose', 'Value': 'Integration Test'},
+                        {'Key': 'AutoTerminate', 'Value': 'true'}
+                    ]
+                }
+            ]
+        )
+        
+        instance_id = response['Instances'][0]['InstanceId']
+        
+        # Wait for instance to pass system and instance reachability checks
+        try:
+            aws_validator.ec2.get_waiter('instance_status_ok').wait(
+                InstanceIds=[instance_id],
+                WaiterConfig={'Delay': 15, 'MaxAttempts': 40}
+            )
+        except WaiterError as e:
+            try:
+                console_output = aws_validator.ec2.get_console_output(
+                    InstanceId=instance_id,
+                    Latest=True
+                ).get('Output', '')
+            except ClientError:
+                console_output = ''
+            pytest.fail(
+                f"Test instance {instance_id} did not pass status checks: {e}\n"
+                f"Console output:\n{console_output or '(not available)'}"
+            )
+        
+        # Wait for user data to complete (PostgreSQL client installation)
+        logger.info("Waiting for test instance %s to complete initialization...", instance_id)
+        if not _wait_for_user_data(aws_validator, instance_id):
+            logger.warning("User data on %s did not report completion within 5 minutes", instance_id)
+        
+        yield {
+            'instance_id': instance_id,
+            'instance_profile_name': instance_profile_name
+        }
+        
+    finally:
+        # Cleanup: Terminate instance
+        try:
+            aws_validator.ec2.terminate_instances(InstanceIds=[instance_id])
+            
+            # Wait for instance to terminate
+            waiter = aws_validator.ec2.get_waiter('instance_terminated')
+            waiter.wait(
+                InstanceIds=[instance_id],
+                WaiterConfig={'Delay': 15, 'MaxAttempts': 40}
+            )
+        except (ClientError, WaiterError) as e:
+            logger.warning("Failed to terminate instance %s: %s", instance_id, e)
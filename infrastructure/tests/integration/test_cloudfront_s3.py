@@ -10,15 +10,16 @@ These tests run against actual AWS resources and validate:
 - HTTPS redirect works (HTTP → HTTPS)
 - File is NOT accessible via direct S3 URL (should return 403)
 - Compression is enabled (check Content-Encoding header)
-- Test file is deleted after validation
 
 Test Workflow:
-1. Upload test file to S3 static assets bucket using boto3
+1. Upload test file to S3 static assets bucket using boto3 (skipped if a
+   previous run already uploaded the same content)
 2. Verify file is accessible via CloudFront URL (HTTPS)
 3. Verify HTTPS redirect works (HTTP → HTTPS)
 4. Verify file is NOT accessible via direct S3 URL (should return 403)
 5. Verify compression is enabled (check Content-Encoding header)
-6. Delete test file after validation
+6. Leave test file in place for reuse by later runs (key is derived from
+   the content hash, so changed content gets a new key)
 
 Requirements:
 - AWS credentials configured
@@ -32,31 +33,118 @@ Cost: Minimal (< $0.01 for test file storage and CloudFront requests)
 Validates: Requirements 5.4, 5.5, 5.6
 """
 
+import gzip
+import hashlib
+import io
+import logging
 import pytest
 import boto3
-import time
 import requests
-from typing import Dict, Any, Optional
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, Iterator, Optional, Tuple
 from botocore.exceptions import ClientError
 from tests.utils import AWSResourceValidator, get_account_id
 
+logger = logging.getLogger(__name__)
+
+# Run every test in this module on one xdist worker so they share the uploaded
+# file, HTTP session, and boto3 clients; other modules run on other workers
+pytestmark = [pytest.mark.xdist_group('cloudfront_s3')]
+
+
+# Test file content (HTML with compressible text), built once at import time.
+# The paragraph is repeated to make the file large enough for compression
+# to be effective.
+_HEAD = b"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>ShowCore CloudFront Test</title>
+</head>
+<body>
+    <h1>ShowCore CloudFront Integration Test</h1>
+    <p>This is a test file for CloudFront and S3 integration testing.</p>
+    <p>This content is repeated multiple times to make the file large enough for compression to be effective.</p>
+"""
+_LOREM = b"    <p>Lorem ipsum dolor sit amet, consectetur adipiscing elit. " \
+    b"Sed do eiusmod tempor incididunt ut labore et dolore magna aliqua.</p>\n"
+_TAIL = b"""
+</body>
+</html>
+"""
+_BODY_BYTES = _HEAD + _LOREM * 50 + _TAIL
+_BODY_LEN = len(_BODY_BYTES)
+# Uploaded precompressed with Content-Encoding: gzip, so CloudFront serves it
+# compressed on every request. mtime=0 keeps the bytes (and key) deterministic.
+_BODY_GZ = gzip.compress(_BODY_BYTES, compresslevel=6, mtime=0)
+_KEY = f"test/cf-integration-{hashlib.sha1(_BODY_GZ).hexdigest()[:16]}.html"
+
+# Single PUT for the current body; multipart kicks in if the file grows past 8 MB
+_TRANSFER_CONFIG = TransferConfig(multipart_threshold=8 * 1024 * 1024, max_concurrency=10, use_threads=True)
+
+# (connect, read) timeout for HTTP probes - connect failures fail fast
+_HTTP_TIMEOUT = (5, 30)
+
+# Error codes meaning the caller cannot read the configuration (skip), as
+# opposed to the configuration being absent (fail)
+_ACCESS_ERROR_CODES = frozenset({
+    'AccessDenied',
+    'AccessDeniedException',
+    'ExpiredToken',
+    'ExpiredTokenException',
+    'InvalidAccessKeyId',
+    'InvalidClientTokenId',
+    'SignatureDoesNotMatch',
+    'UnrecognizedClientException',
+})
+
 
 @pytest.fixture(scope="module")
-def aws_validator():
+def http_session() -> Iterator[requests.Session]:
     """
-    Create AWS resource validator for integration tests.
+    Create a shared HTTP session for CloudFront and S3 requests.
     
-    Returns:
-        AWSResourceValidator instance configured for us-east-1
+    All HTTP checks reuse pooled keep-alive connections instead of opening a
+    new TCP + TLS connection per request. The adapters retry 404 (CloudFront
+    propagation) and 5xx responses with exponential backoff, so callers do not
+    need their own retry loops.
+    
+    Yields:
+        requests.Session with pooled, retrying adapters for http:// and https://
+    
+    Cleanup:
+        Closes the session and its pooled connections
     """
-    return AWSResourceValidator(region='us-east-1')
+    retry = Retry(
+        total=5,
+        status_forcelist=[404, 502, 503, 504],
+        allowed_methods=['GET', 'HEAD'],
+        backoff_factor=1.0,
+        respect_retry_after_header=True,
+        raise_on_status=False,  # Return the last response so tests can assert on it
+    )
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    
+    yield session
+    
+    session.close()
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def account_id() -> str:
     """
     Get AWS account ID for bucket name construction.
     
+    Session-scoped so sts:GetCallerIdentity is called once per test run.
+    
     Returns:
         AWS account ID
     
@@ -89,7 +177,7 @@ def s3_bucket_info(aws_validator: AWSResourceValidator, account_id: str) -> Dict
     
     # Verify bucket exists
     try:
-        aws_validator.s3.head_bucket(Bucket=bucket_name)
+        response = aws_validator.s3.head_bucket(Bucket=bucket_name)
     except ClientError as e:
         error_code = e.response['Error']['Code']
         if error_code == '404':
@@ -97,13 +185,8 @@ def s3_bucket_info(aws_validator: AWSResourceValidator, account_id: str) -> Dict
         else:
             pytest.skip(f"Error accessing S3 bucket {bucket_name}: {e}")
     
-    # Get bucket region
-    try:
-        response = aws_validator.s3.get_bucket_location(Bucket=bucket_name)
-        # Note: us-east-1 returns None for LocationConstraint
-        region = response.get('LocationConstraint') or 'us-east-1'
-    except ClientError as e:
-        pytest.skip(f"Error getting bucket location: {e}")
+    # head_bucket already reports the bucket region, so no get_bucket_location call
+    region = response['ResponseMetadata']['HTTPHeaders'].get('x-amz-bucket-region', 'us-east-1')
     
     return {
         'bucket_name': bucket_name,
@@ -111,12 +194,29 @@ def s3_bucket_info(aws_validator: AWSResourceValidator, account_id: str) -> Dict
     }
 
 
+def _has_bucket_origin(origins: Dict[str, Any], bucket_name: str) -> bool:
+    """Check whether any CloudFront origin domain name matches the S3 bucket."""
+    return any(
+        bucket_name in origin.get('DomainName', '')
+        for origin in origins.get('Items', [])
+    )
+
+
 @pytest.fixture(scope="module")
-def cloudfront_info(aws_validator: AWSResourceValidator, s3_bucket_info: Dict[str, Any]) -> Dict[str, Any]:
+def cloudfront_info(
+    request: pytest.FixtureRequest,
+    aws_validator: AWSResourceValidator,
+    s3_bucket_info: Dict[str, Any]
+) -> Dict[str, Any]:
     """
     Get CloudFront distribution information.
     
+    The distribution ID found for the bucket is kept in the pytest cache, so
+    later runs do a single get_distribution call instead of listing every
+    distribution in the account.
+    
     Args:
+        request: pytest fixture request (for the pytest cache)
         aws_validator: AWS resource validator
         s3_bucket_info: S3 bucket information
     
@@ -126,27 +226,38 @@ def cloudfront_info(aws_validator: AWSResourceValidator, s3_bucket_info: Dict[st
     Raises:
         pytest.skip: If distribution not found (infrastructure not deployed)
     """
-    # Get all CloudFront distributions
-    try:
-        response = aws_validator.cloudfront.list_distributions()
-        distributions = response.get('DistributionList', {}).get('Items', [])
-    except ClientError as e:
-        pytest.skip(f"Error listing CloudFront distributions: {e}")
-    
-    # Find distribution with S3 static assets bucket as origin
     bucket_name = s3_bucket_info['bucket_name']
+    cache_key = f"showcore/cf_dist/{bucket_name}"
     target_distribution = None
     
-    for dist in distributions:
-        origins = dist.get('Origins', {}).get('Items', [])
-        for origin in origins:
-            # Check if origin domain name matches S3 bucket
-            origin_domain = origin.get('DomainName', '')
-            if bucket_name in origin_domain:
+    # Try the cached distribution ID first, verifying its origin still matches
+    cached_id = request.config.cache.get(cache_key, None)
+    if cached_id:
+        try:
+            dist = aws_validator.cloudfront.get_distribution(Id=cached_id)['Distribution']
+            if _has_bucket_origin(dist['DistributionConfig'].get('Origins', {}), bucket_name):
                 target_distribution = dist
-                break
+        except ClientError:
+            pass
+    
+    # Fall back to finding the distribution with S3 static assets bucket as origin
+    if not target_distribution:
+        try:
+            paginator = aws_validator.cloudfront.get_paginator('list_distributions')
+            target_distribution = next(
+                (
+                    dist
+                    for page in paginator.paginate()
+                    for dist in page.get('DistributionList', {}).get('Items', [])
+                    if _has_bucket_origin(dist.get('Origins', {}), bucket_name)
+                ),
+                None
+            )
+        except ClientError as e:
+            pytest.skip(f"Error listing CloudFront distributions: {e}")
+        
         if target_distribution:
-            break
+            request.config.cache.set(cache_key, target_distribution['Id'])
     
     if not target_distribution:
         pytest.skip(f"CloudFront distribution with S3 bucket {bucket_name} as origin not found - infrastructure not deployed")
@@ -167,100 +278,262 @@ def cloudfront_info(aws_validator: AWSResourceValidator, s3_bucket_info: Dict[st
     }
 
 
+@pytest.fixture(scope="module", autouse=True)
+def _precheck(
+    aws_validator: AWSResourceValidator,
+    s3_bucket_info: Dict[str, Any],
+    cloudfront_info: Dict[str, Any]
+) -> None:
+    """
+    Check S3 and CloudFront prerequisites once before any test in the module.
+    
+    Fetches the bucket's public access block, its policy status, and the
+    distribution config concurrently. A private bucket behind an origin access
+    identity/control is required for every probe, so a misconfiguration fails
+    here instead of after the upload and CloudFront propagation wait.
+    
+    Args:
+        aws_validator: AWS resource validator
+        s3_bucket_info: S3 bucket information
+        cloudfront_info: CloudFront distribution information
+    
+    Raises:
+        pytest.skip: If credentials or permissions prevent reading the configuration
+        pytest.fail: If the bucket is public, has no public access block or
+            bucket policy, or the origin has no access control
+    """
+    bucket_name = s3_bucket_info['bucket_name']
+    
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        public_access_block = executor.submit(aws_validator.s3.get_public_access_block, Bucket=bucket_name)
+        policy_status = executor.submit(aws_validator.s3.get_bucket_policy_status, Bucket=bucket_name)
+        distribution_config = executor.submit(
+            aws_validator.cloudfront.get_distribution_config,
+            Id=cloudfront_info['distribution_id']
+        )
+        
+        try:
+            block_config = public_access_block.result()['PublicAccessBlockConfiguration']
+            is_public = policy_status.result()['PolicyStatus']['IsPublic']
+            origins = distribution_config.result()['DistributionConfig']['Origins'].get('Items', [])
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            if error_code in _ACCESS_ERROR_CODES:
+                pytest.skip(f"Unable to check S3/CloudFront prerequisites: {e}")
+            if error_code == 'NoSuchPublicAccessBlockConfiguration':
+                pytest.fail(f"S3 bucket {bucket_name} has no public access block configured")
+            if error_code == 'NoSuchBucketPolicy':
+                pytest.fail(f"S3 bucket {bucket_name} has no bucket policy granting CloudFront access")
+            pytest.fail(f"Failed to check S3/CloudFront prerequisites: {e}")
+    
+    if not all(block_config.values()) or is_public:
+        pytest.fail(f"S3 bucket {bucket_name} is not private (public access block: {block_config}, public policy: {is_public})")
+    
+    bucket_origins = [origin for origin in origins if bucket_name in origin.get('DomainName', '')]
+    if not any(
+        origin.get('OriginAccessControlId') or origin.get('S3OriginConfig', {}).get('OriginAccessIdentity')
+        for origin in bucket_origins
+    ):
+        pytest.fail(f"CloudFront origin for {bucket_name} has no origin access control or identity")
+
+
 @pytest.fixture(scope="module")
-def test_file_content() -> str:
+def test_file_content() -> bytes:
     """
-    Generate test file content for upload.
+    Get test file content for upload.
     
     Returns:
-        Test file content (HTML with compressible text)
+        Test file content as UTF-8 bytes (HTML with compressible text)
     """
-    # Create HTML content that is compressible (for compression test)
-    # Repeat text to make it large enough for compression to be effective
-    content = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>ShowCore CloudFront Test</title>
-</head>
-<body>
-    <h1>ShowCore CloudFront Integration Test</h1>
-    <p>This is a test file for CloudFront and S3 integration testing.</p>
-    <p>This content is repeated multiple times to make the file large enough for compression to be effective.</p>
-""" + "    <p>Lorem ipsum dolor sit amet, consectetur adipiscing elit. " \
-      "Sed do eiusmod tempor incididunt ut labore et dolore magna aliqua.</p>\n" * 50 + """
-</body>
-</html>
-"""
-    return content
+    return _BODY_BYTES
 
 
 @pytest.fixture(scope="module")
 def uploaded_test_file(
     aws_validator: AWSResourceValidator,
     s3_bucket_info: Dict[str, Any],
-    test_file_content: str
+    test_file_content: bytes
 ) -> Dict[str, Any]:
     """
     Upload test file to S3 static assets bucket.
     
+    The key is derived from the content hash, so if a previous run already
+    uploaded the same content the upload is skipped and CloudFront can serve
+    the object from its cache.
+    
     Args:
         aws_validator: AWS resource validator
         s3_bucket_info: S3 bucket information
         test_file_content: Test file content
     
     Returns:
-        Dict with test file key and S3 URL
-    
-    Yields:
-        Test file information
+        Dict with test file key, S3 URL, content, and whether it was reused
     
-    Cleanup:
-        Deletes the test file after tests complete
+    Raises:
+        pytest.fail: If the test file cannot be uploaded
     """
     bucket_name = s3_bucket_info['bucket_name']
-    test_file_key = f"test/cloudfront-integration-test-{int(time.time())}.html"
+    test_file_key = _KEY
     
     try:
-        # Upload test file to S3
-        aws_validator.s3.put_object(
-            Bucket=bucket_name,
-            Key=test_file_key,
-            Body=test_file_content.encode('utf-8'),
-            ContentType='text/html',
-            CacheControl='max-age=300',  # 5 minutes cache for testing
-        )
-        
-        # Construct S3 URL (direct access - should be blocked)
-        s3_url = f"https://{bucket_name}.s3.amazonaws.com/{test_file_key}"
-        
-        # Wait a moment for S3 to propagate
-        time.sleep(2)
-        
-        yield {
-            'key': test_file_key,
-            's3_url': s3_url,
-            'content': test_file_content
-        }
-        
-    finally:
-        # Cleanup: Delete test file
+        aws_validator.s3.head_object(Bucket=bucket_name, Key=test_file_key)
+        reused = True
+        logger.info("✓ Reusing test file from a previous run: %s", test_file_key)
+    except ClientError:
+        reused = False
+    
+    if not reused:
         try:
-            aws_validator.s3.delete_object(
-                Bucket=bucket_name,
-                Key=test_file_key
+            # Upload test file to S3
+            aws_validator.s3.upload_fileobj(
+                io.BytesIO(_BODY_GZ),
+                bucket_name,
+                test_file_key,
+                ExtraArgs={
+                    'ContentType': 'text/html',
+                    'ContentEncoding': 'gzip',
+                    'CacheControl': 'max-age=300',  # 5 minutes cache for testing
+                },
+                Config=_TRANSFER_CONFIG,
             )
-            print(f"✓ Deleted test file: {test_file_key}")
-        except ClientError as e:
-            print(f"Warning: Failed to delete test file {test_file_key}: {e}")
+        except (ClientError, S3UploadFailedError) as e:
+            pytest.fail(f"Failed to upload test file {test_file_key}: {e}")
+    
+    # Construct S3 URL (direct access - should be blocked)
+    s3_url = f"https://{bucket_name}.s3.amazonaws.com/{test_file_key}"
+    
+    return {
+        'key': test_file_key,
+        's3_url': s3_url,
+        'content': test_file_content,
+        'reused': reused
+    }
+
+
+@pytest.fixture(scope="module")
+def cloudfront_ready(
+    http_session: requests.Session,
+    cloudfront_info: Dict[str, Any],
+    uploaded_test_file: Dict[str, Any]
+) -> str:
+    """
+    Wait until the uploaded test file is served by CloudFront.
+    
+    Sends a HEAD request that the session's retry policy repeats with
+    exponential backoff while CloudFront returns 404, so it returns as soon as
+    the file is live instead of sleeping a fixed time before every test.
+    
+    Args:
+        http_session: Shared HTTP session
+        cloudfront_info: CloudFront distribution information
+        uploaded_test_file: Uploaded test file information
+    
+    Returns:
+        CloudFront HTTPS URL of the test file
+    
+    Raises:
+        pytest.fail: If the file is not served after all retries
+    """
+    cloudfront_url = f"https://{cloudfront_info['domain_name']}/{uploaded_test_file['key']}"
+    
+    try:
+        status = http_session.head(cloudfront_url, timeout=_HTTP_TIMEOUT).status_code
+    except requests.exceptions.RequestException as e:
+        pytest.fail(f"Failed to access CloudFront URL {cloudfront_url}: {e}")
+    
+    if status != 200:
+        pytest.fail(f"CloudFront did not serve {cloudfront_url} (last status: {status})")
+    
+    # Warm DNS, TLS sessions, and pooled connections for the other probe hosts
+    # in one parallel round; the probes themselves assert on the responses
+    http_url = f"http://{cloudfront_info['domain_name']}/{uploaded_test_file['key']}"
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        warmups = [
+            executor.submit(http_session.head, http_url, allow_redirects=False, timeout=_HTTP_TIMEOUT),
+            executor.submit(http_session.head, uploaded_test_file['s3_url'], timeout=_HTTP_TIMEOUT),
+        ]
+        for warmup in warmups:
+            try:
+                warmup.result()
+            except requests.exceptions.RequestException:
+                pass
+    
+    return cloudfront_url
+
+
+def _probe_redirect(
+    http_session: requests.Session,
+    http_url: str
+) -> Tuple[requests.Response, Optional[requests.Response]]:
+    """Request the HTTP URL without following redirects, then follow Location once."""
+    response = http_session.head(http_url, allow_redirects=False, timeout=_HTTP_TIMEOUT)
+    location = response.headers.get('Location')
+    if not location:
+        return response, None
+    return response, http_session.head(location, timeout=_HTTP_TIMEOUT)
+
+
+@pytest.fixture(scope="module")
+def probe_results(
+    http_session: requests.Session,
+    cloudfront_info: Dict[str, Any],
+    cloudfront_ready: str,
+    uploaded_test_file: Dict[str, Any]
+) -> Dict[str, requests.Response]:
+    """
+    Issue all CloudFront and S3 HTTP probes concurrently.
+    
+    The probes are independent read-only requests for the same key, so they
+    run in a thread pool once CloudFront serves the file. The tests below only
+    assert on the responses.
+    
+    Args:
+        http_session: Shared HTTP session
+        cloudfront_info: CloudFront distribution information
+        cloudfront_ready: CloudFront HTTPS URL of the propagated test file
+        uploaded_test_file: Uploaded test file information
+    
+    Returns:
+        Dict mapping probe name to its HTTP response
+    
+    Raises:
+        pytest.fail: If any probe request fails
+    """
+    http_url = f"http://{cloudfront_info['domain_name']}/{uploaded_test_file['key']}"
+    # Probes that only check status and headers use HEAD to skip the body.
+    # The compression check needs a GET for the encoding header but streams it
+    # and closes without reading or decoding the body.
+    probes = {
+        'cf_https': ('GET', cloudfront_ready, {}),
+        's3_direct': ('HEAD', uploaded_test_file['s3_url'], {}),
+        # Request gzip only so CloudFront cannot negotiate another encoding
+        'cf_compressed': ('GET', cloudfront_ready, {'headers': {'Accept-Encoding': 'gzip'}, 'stream': True}),
+    }
+    
+    with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+        futures = {
+            name: executor.submit(http_session.request, method, url, timeout=_HTTP_TIMEOUT, **kwargs)
+            for name, (method, url, kwargs) in probes.items()
+        }
+        redirect = executor.submit(_probe_redirect, http_session, http_url)
+        try:
+            results = {name: future.result() for name, future in futures.items()}
+            results['cf_http_noredir'], results['cf_http_redirected'] = redirect.result()
+        except requests.exceptions.RequestException as e:
+            pytest.fail(f"CloudFront/S3 probe request failed: {e}")
+    
+    # Headers stay available after the streamed body is discarded
+    results['cf_compressed'].close()
+    
+    return results
 
 
 @pytest.mark.integration
 @pytest.mark.aws
 @pytest.mark.slow
 def test_file_accessible_via_cloudfront_https(
-    cloudfront_info: Dict[str, Any],
+    probe_results: Dict[str, requests.Response],
+    cloudfront_ready: str,
     uploaded_test_file: Dict[str, Any]
 ):
     """
@@ -273,48 +546,20 @@ def test_file_accessible_via_cloudfront_https(
     4. Response headers indicate CloudFront delivery
     
     Args:
-        cloudfront_info: CloudFront distribution information
+        probe_results: Concurrent HTTP probe responses
+        cloudfront_ready: CloudFront HTTPS URL of the propagated test file
         uploaded_test_file: Uploaded test file information
     
     Validates: Requirements 5.5
     """
-    # Construct CloudFront HTTPS URL
-    cloudfront_url = f"https://{cloudfront_info['domain_name']}/{uploaded_test_file['key']}"
-    
-    # Wait for CloudFront to propagate (can take a few seconds)
-    # CloudFront has eventual consistency, so we retry a few times
-    max_retries = 5
-    retry_delay = 10  # seconds
-    
-    for attempt in range(max_retries):
-        try:
-            # Make HTTPS request to CloudFront
-            response = requests.get(cloudfront_url, timeout=30)
-            
-            # If we get 200, break out of retry loop
-            if response.status_code == 200:
-                break
-            
-            # If we get 404, CloudFront might not have propagated yet
-            if response.status_code == 404 and attempt < max_retries - 1:
-                print(f"CloudFront returned 404, waiting {retry_delay}s for propagation (attempt {attempt + 1}/{max_retries})...")
-                time.sleep(retry_delay)
-                continue
-            
-        except requests.exceptions.RequestException as e:
-            if attempt < max_retries - 1:
-                print(f"Request failed, retrying in {retry_delay}s (attempt {attempt + 1}/{max_retries}): {e}")
-                time.sleep(retry_delay)
-                continue
-            else:
-                pytest.fail(f"Failed to access CloudFront URL after {max_retries} attempts: {e}")
+    response = probe_results['cf_https']
     
     # Verify response status is 200 OK
     assert response.status_code == 200, \
         f"CloudFront URL returned status {response.status_code} (expected 200)"
     
     # Verify content matches uploaded file
-    assert response.text == uploaded_test_file['content'], \
+    assert response.content == uploaded_test_file['content'], \
         "CloudFront response content does not match uploaded file"
     
     # Verify response headers indicate CloudFront delivery
@@ -322,19 +567,18 @@ def test_file_accessible_via_cloudfront_https(
     assert 'X-Cache' in response.headers or 'x-amz-cf-id' in response.headers, \
         "Response headers do not indicate CloudFront delivery"
     
-    print(f"✓ File accessible via CloudFront HTTPS URL: {cloudfront_url}")
-    print(f"✓ Response status: {response.status_code}")
-    print(f"✓ Content length: {len(response.text)} bytes")
+    logger.info("✓ File accessible via CloudFront HTTPS URL: %s", cloudfront_ready)
+    logger.info("✓ Response status: %s", response.status_code)
+    logger.info("✓ Content length: %s bytes", len(response.content))
     if 'X-Cache' in response.headers:
-        print(f"✓ CloudFront cache status: {response.headers['X-Cache']}")
+        logger.info("✓ CloudFront cache status: %s", response.headers['X-Cache'])
 
 
 @pytest.mark.integration
 @pytest.mark.aws
 @pytest.mark.slow
 def test_https_redirect_works(
-    cloudfront_info: Dict[str, Any],
-    uploaded_test_file: Dict[str, Any]
+    probe_results: Dict[str, requests.Response]
 ):
     """
     Test that HTTP requests are redirected to HTTPS.
@@ -346,55 +590,41 @@ def test_https_redirect_works(
     4. Final response is successful (200 OK)
     
     Args:
-        cloudfront_info: CloudFront distribution information
-        uploaded_test_file: Uploaded test file information
+        probe_results: Concurrent HTTP probe responses
     
     Validates: Requirements 5.6
     """
-    # Construct CloudFront HTTP URL (not HTTPS)
-    http_url = f"http://{cloudfront_info['domain_name']}/{uploaded_test_file['key']}"
-    https_url = f"https://{cloudfront_info['domain_name']}/{uploaded_test_file['key']}"
+    response = probe_results['cf_http_noredir']
+    response_final = probe_results['cf_http_redirected']
     
-    # Wait for CloudFront to propagate
-    time.sleep(10)
+    # Verify redirect status (301 Moved Permanently or 302 Found)
+    assert response.status_code in [301, 302], \
+        f"HTTP request returned status {response.status_code} (expected 301 or 302 redirect)"
     
-    try:
-        # Make HTTP request (should redirect to HTTPS)
-        # Don't follow redirects automatically so we can verify the redirect
-        response = requests.get(http_url, allow_redirects=False, timeout=30)
-        
-        # Verify redirect status (301 Moved Permanently or 302 Found)
-        assert response.status_code in [301, 302], \
-            f"HTTP request returned status {response.status_code} (expected 301 or 302 redirect)"
-        
-        # Verify Location header points to HTTPS URL
-        location = response.headers.get('Location', '')
-        assert location.startswith('https://'), \
-            f"Redirect Location header does not start with https:// (got: {location})"
-        
-        # Now follow the redirect and verify final response is successful
-        response_final = requests.get(http_url, allow_redirects=True, timeout=30)
-        assert response_final.status_code == 200, \
-            f"Final response after redirect returned status {response_final.status_code} (expected 200)"
-        
-        # Verify final URL is HTTPS
-        assert response_final.url.startswith('https://'), \
-            f"Final URL is not HTTPS (got: {response_final.url})"
-        
-        print(f"✓ HTTP request redirected to HTTPS")
-        print(f"✓ Redirect status: {response.status_code}")
-        print(f"✓ Redirect location: {location}")
-        print(f"✓ Final response status: {response_final.status_code}")
-        
-    except requests.exceptions.RequestException as e:
-        pytest.fail(f"Failed to test HTTPS redirect: {e}")
+    # Verify Location header points to HTTPS URL
+    location = response.headers.get('Location', '')
+    assert location.startswith('https://'), \
+        f"Redirect Location header does not start with https:// (got: {location})"
+    
+    # Verify final response after following the redirect is successful
+    assert response_final.status_code == 200, \
+        f"Final response after redirect returned status {response_final.status_code} (expected 200)"
+    
+    # Verify final URL is HTTPS
+    assert response_final.url.startswith('https://'), \
+        f"Final URL is not HTTPS (got: {response_final.url})"
+    
+    logger.info("✓ HTTP request redirected to HTTPS")
+    logger.info("✓ Redirect status: %s", response.status_code)
+    logger.info("✓ Redirect location: %s", location)
+    logger.info("✓ Final response status: %s", response_final.status_code)
 
 
 @pytest.mark.integration
 @pytest.mark.aws
 @pytest.mark.slow
 def test_file_not_accessible_via_direct_s3_url(
-    uploaded_test_file: Dict[str, Any]
+    probe_results: Dict[str, requests.Response]
 ):
     """
     Test that file is NOT accessible via direct S3 URL (should return 403).
@@ -405,228 +635,213 @@ def test_file_not_accessible_via_direct_s3_url(
     3. Origin Access Control (OAC) is properly configured
     
     Args:
-        uploaded_test_file: Uploaded test file information
+        probe_results: Concurrent HTTP probe responses
     
     Validates: Requirements 5.4
     """
-    # Get direct S3 URL
-    s3_url = uploaded_test_file['s3_url']
+    response = probe_results['s3_direct']
     
-    try:
-        # Attempt to access file via direct S3 URL (should be blocked)
-        response = requests.get(s3_url, timeout=30)
-        
-        # Verify access is denied (403 Forbidden)
-        assert response.status_code == 403, \
-            f"Direct S3 URL returned status {response.status_code} (expected 403 Forbidden). " \
-            f"S3 bucket may not be properly configured for private access."
-        
-        print(f"✓ Direct S3 URL access blocked (403 Forbidden)")
-        print(f"✓ S3 bucket is private (CloudFront only access)")
-        print(f"✓ Origin Access Control (OAC) is properly configured")
-        
-    except requests.exceptions.RequestException as e:
-        pytest.fail(f"Failed to test direct S3 URL access: {e}")
+    # Verify access is denied (403 Forbidden)
+    assert response.status_code == 403, \
+        f"Direct S3 URL returned status {response.status_code} (expected 403 Forbidden). " \
+        f"S3 bucket may not be properly configured for private access."
+    
+    logger.info("✓ Direct S3 URL access blocked (403 Forbidden)")
+    logger.info("✓ S3 bucket is private (CloudFront only access)")
+    logger.info("✓ Origin Access Control (OAC) is properly configured")
 
 
 @pytest.mark.integration
 @pytest.mark.aws
 @pytest.mark.slow
 def test_compression_enabled(
-    cloudfront_info: Dict[str, Any],
+    probe_results: Dict[str, requests.Response],
     uploaded_test_file: Dict[str, Any]
 ):
     """
     Test that compression is enabled (check Content-Encoding header).
     
     This test verifies that:
-    1. CloudFront compresses responses (gzip or brotli)
+    1. CloudFront serves the response compressed (gzip)
     2. Content-Encoding header is present
     3. Compressed content is smaller than original
     
-    Note: Compression may not be applied for small files or if the file
-    is already compressed. This test uses a large HTML file to ensure
-    compression is applied.
+    Note: The test file is uploaded precompressed with Content-Encoding: gzip,
+    which CloudFront passes through, so the header is present on every
+    request rather than only after CloudFront has compressed and cached it.
+    The distribution's Compress setting is checked by
+    test_infra_config[compress_enabled].
     
     Args:
-        cloudfront_info: CloudFront distribution information
+        probe_results: Concurrent HTTP probe responses
         uploaded_test_file: Uploaded test file information
     
     Validates: Requirements 5.6
     """
-    # Construct CloudFront HTTPS URL
-    cloudfront_url = f"https://{cloudfront_info['domain_name']}/{uploaded_test_file['key']}"
+    response = probe_results['cf_compressed']
     
-    # Wait for CloudFront to propagate
-    time.sleep(10)
+    # Verify response is successful
+    assert response.status_code == 200, \
+        f"CloudFront URL returned status {response.status_code} (expected 200)"
     
-    try:
-        # Make request with Accept-Encoding header to request compression
-        headers = {
-            'Accept-Encoding': 'gzip, deflate, br'  # Request gzip, deflate, or brotli
-        }
-        response = requests.get(cloudfront_url, headers=headers, timeout=30)
-        
-        # Verify response is successful
-        assert response.status_code == 200, \
-            f"CloudFront URL returned status {response.status_code} (expected 200)"
-        
-        # Check if Content-Encoding header is present
-        content_encoding = response.headers.get('Content-Encoding', '').lower()
-        
-        # Compression may not be applied on first request (cache miss)
-        # or if CloudFront hasn't processed the compression policy yet
-        # We'll check if compression is enabled, but won't fail if it's not
-        # (CloudFront compression can take time to propagate)
-        if content_encoding in ['gzip', 'br', 'deflate']:
-            print(f"✓ Compression enabled: {content_encoding}")
-            print(f"✓ Content-Encoding header present: {content_encoding}")
-            
-            # Verify compressed content is smaller than original
-            # Note: requests automatically decompresses, so we check raw response
-            original_size = len(uploaded_test_file['content'].encode('utf-8'))
-            # The response.text is already decompressed, so we can't directly compare
-            # But we can verify the header is present
-            print(f"✓ Original content size: {original_size} bytes")
-            print(f"✓ CloudFront is configured to compress responses")
-        else:
-            # Compression may not be applied yet (cache miss, propagation delay)
-            print(f"⚠ Compression not applied in this response (Content-Encoding: {content_encoding or 'none'})")
-            print(f"⚠ This may be due to cache miss or CloudFront propagation delay")
-            print(f"⚠ CloudFront compression is configured and will be applied on subsequent requests")
-            
-            # We won't fail the test, as compression configuration is correct
-            # even if it's not applied on this specific request
-            # The CDK stack configures compression, which is what we're validating
-        
-        # Verify CloudFront compression is configured (check distribution config)
-        # This is the actual validation - configuration, not runtime behavior
-        print(f"✓ CloudFront distribution is configured with automatic compression")
-        
-    except requests.exceptions.RequestException as e:
-        pytest.fail(f"Failed to test compression: {e}")
+    # Verify Content-Encoding header is present
+    content_encoding = response.headers.get('Content-Encoding', '').lower()
+    assert content_encoding == 'gzip', \
+        f"Expected gzip, got {content_encoding!r}"
+    
+    # Verify compressed content is smaller than original
+    # Note: requests decompresses the body, so compare the transferred length
+    content_length = response.headers.get('Content-Length')
+    if content_length is not None:
+        assert int(content_length) < _BODY_LEN, \
+            f"Compressed size {content_length} bytes is not smaller than original {_BODY_LEN} bytes"
+    
+    logger.info("✓ Compression enabled: %s", content_encoding)
+    logger.info("✓ Original content size: %s bytes", _BODY_LEN)
+    logger.info("✓ Compressed content size: %s bytes", content_length or len(_BODY_GZ))
 
 
-@pytest.mark.integration
-@pytest.mark.aws
-def test_s3_bucket_encryption(
+@pytest.fixture(scope="module")
+def aws_config_snapshot(
     aws_validator: AWSResourceValidator,
-    s3_bucket_info: Dict[str, Any]
-):
+    s3_bucket_info: Dict[str, Any],
+    cloudfront_info: Dict[str, Any]
+) -> Dict[str, Any]:
     """
-    Test that S3 bucket has encryption at rest enabled.
+    Fetch S3 bucket and CloudFront distribution configuration concurrently.
     
-    This test verifies that:
-    1. S3 bucket has encryption enabled
-    2. Encryption uses SSE-S3 (AWS managed keys, not KMS)
+    The three API calls are independent, so they run in a thread pool and
+    the configuration tests below only assert on the snapshot.
     
     Args:
         aws_validator: AWS resource validator
         s3_bucket_info: S3 bucket information
+        cloudfront_info: CloudFront distribution information
     
-    Validates: Requirements 5.3, 9.9
+    Returns:
+        Dict with encryption algorithm, versioning flag, and distribution config
+    
+    Raises:
+        pytest.fail: If the distribution configuration cannot be retrieved
     """
     bucket_name = s3_bucket_info['bucket_name']
+    distribution_id = cloudfront_info['distribution_id']
     
-    # Get bucket encryption configuration
-    encryption_algo = aws_validator.get_bucket_encryption(bucket_name)
-    
-    # Verify encryption is enabled
-    assert encryption_algo is not None, \
-        f"S3 bucket {bucket_name} does not have encryption enabled"
-    
-    # Verify encryption uses SSE-S3 (not KMS for cost optimization)
-    assert encryption_algo == 'AES256', \
-        f"S3 bucket uses {encryption_algo} encryption (expected AES256/SSE-S3 for cost optimization)"
-    
-    print(f"✓ S3 bucket {bucket_name} has encryption at rest enabled")
-    print(f"✓ Encryption algorithm: {encryption_algo} (SSE-S3, cost optimized)")
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        encryption = executor.submit(aws_validator.get_bucket_encryption, bucket_name)
+        versioning = executor.submit(aws_validator.check_bucket_versioning, bucket_name)
+        distribution = executor.submit(aws_validator.cloudfront.get_distribution, Id=distribution_id)
+        
+        try:
+            distribution_config = distribution.result()['Distribution']['DistributionConfig']
+        except ClientError as e:
+            pytest.fail(f"Failed to get distribution configuration: {e}")
+        
+        return {
+            'encryption': encryption.result(),
+            'versioning': versioning.result(),
+            'distribution': distribution_config
+        }
 
 
 @pytest.mark.integration
 @pytest.mark.aws
-def test_s3_bucket_versioning(
-    aws_validator: AWSResourceValidator,
-    s3_bucket_info: Dict[str, Any]
+@pytest.mark.parametrize('check', [
+    'encryption_aes256',
+    'versioning_enabled',
+    'dist_enabled',
+    'price_class_100',
+    'https_only',
+    'tls_12_min',
+    'compress_enabled',
+])
+def test_infra_config(
+    aws_config_snapshot: Dict[str, Any],
+    s3_bucket_info: Dict[str, Any],
+    cloudfront_info: Dict[str, Any],
+    check: str
 ):
     """
-    Test that S3 bucket has versioning enabled.
-    
-    This test verifies that:
-    1. S3 bucket has versioning enabled
-    2. Versioning provides data protection and recovery capability
+    Test S3 bucket and CloudFront distribution configuration.
+    
+    Each case asserts one check against the shared configuration snapshot:
+    - encryption_aes256: S3 bucket has encryption at rest enabled using SSE-S3
+      (AWS managed keys, not KMS)
+    - versioning_enabled: S3 bucket has versioning enabled for data protection
+      and recovery capability
+    - dist_enabled: Distribution is deployed and enabled
+    - price_class_100: Price class is PriceClass_100 (cost optimization)
+    - https_only: HTTPS-only viewer protocol is configured
+    - tls_12_min: TLS 1.2 minimum is configured
+    - compress_enabled: Default cache behavior compresses objects
     
     Args:
-        aws_validator: AWS resource validator
+        aws_config_snapshot: S3 and CloudFront configuration snapshot
         s3_bucket_info: S3 bucket information
+        cloudfront_info: CloudFront distribution information
+        check: Name of the configuration check to run
     
-    Validates: Requirements 5.1
+    Validates: Requirements 5.1, 5.3, 5.6, 5.7, 9.9, 9.11
     """
     bucket_name = s3_bucket_info['bucket_name']
+    distribution_id = cloudfront_info['distribution_id']
+    config = aws_config_snapshot['distribution']
     
-    # Check if versioning is enabled
-    versioning_enabled = aws_validator.check_bucket_versioning(bucket_name)
+    if check == 'encryption_aes256':
+        encryption_algo = aws_config_snapshot['encryption']
+        
+        # Verify encryption is enabled
+        assert encryption_algo is not None, \
+            f"S3 bucket {bucket_name} does not have encryption enabled"
+        
+        # Verify encryption uses SSE-S3 (not KMS for cost optimization)
+        assert encryption_algo == 'AES256', \
+            f"S3 bucket uses {encryption_algo} encryption (expected AES256/SSE-S3 for cost optimization)"
+        
+        logger.info("✓ S3 bucket %s encryption algorithm: %s (SSE-S3, cost optimized)", bucket_name, encryption_algo)
     
-    # Verify versioning is enabled
-    assert versioning_enabled, \
-        f"S3 bucket {bucket_name} does not have versioning enabled"
+    elif check == 'versioning_enabled':
+        assert aws_config_snapshot['versioning'], \
+            f"S3 bucket {bucket_name} does not have versioning enabled"
+        
+        logger.info("✓ S3 bucket %s has versioning enabled", bucket_name)
     
-    print(f"✓ S3 bucket {bucket_name} has versioning enabled")
-    print(f"✓ Versioning provides data protection and recovery capability")
-
-
-@pytest.mark.integration
-@pytest.mark.aws
-def test_cloudfront_distribution_configuration(
-    aws_validator: AWSResourceValidator,
-    cloudfront_info: Dict[str, Any]
-):
-    """
-    Test CloudFront distribution configuration.
+    elif check == 'dist_enabled':
+        assert config['Enabled'], \
+            f"CloudFront distribution {distribution_id} is not enabled"
+        
+        logger.info("✓ CloudFront distribution %s is deployed and enabled", distribution_id)
     
-    This test verifies that:
-    1. Distribution is deployed and enabled
-    2. Price class is PriceClass_100 (cost optimization)
-    3. HTTPS-only viewer protocol is configured
-    4. TLS 1.2 minimum is configured
+    elif check == 'price_class_100':
+        price_class = config.get('PriceClass', '')
+        assert price_class == 'PriceClass_100', \
+            f"CloudFront distribution uses {price_class} (expected PriceClass_100 for cost optimization)"
+        
+        logger.info("✓ Price class: %s (cost optimized)", price_class)
     
-    Args:
-        aws_validator: AWS resource validator
-        cloudfront_info: CloudFront distribution information
+    elif check == 'https_only':
+        default_behavior = config.get('DefaultCacheBehavior', {})
+        viewer_protocol_policy = default_behavior.get('ViewerProtocolPolicy', '')
+        assert viewer_protocol_policy in ['https-only', 'redirect-to-https'], \
+            f"CloudFront distribution viewer protocol is {viewer_protocol_policy} (expected https-only or redirect-to-https)"
+        
+        logger.info("✓ Viewer protocol policy: %s (HTTPS enforced)", viewer_protocol_policy)
     
-    Validates: Requirements 5.6, 5.7, 9.11
-    """
-    distribution_id = cloudfront_info['distribution_id']
+    elif check == 'tls_12_min':
+        minimum_protocol_version = config.get('ViewerCertificate', {}).get('MinimumProtocolVersion', '')
+        assert 'TLSv1.2' in minimum_protocol_version, \
+            f"CloudFront distribution minimum protocol version is {minimum_protocol_version} (expected TLSv1.2 or higher)"
+        
+        logger.info("✓ Minimum protocol version: %s (TLS 1.2+)", minimum_protocol_version)
+    
+    elif check == 'compress_enabled':
+        # The test object is uploaded precompressed, so the response header alone
+        # does not prove CloudFront compression is on; check the cache behavior
+        default_behavior = config.get('DefaultCacheBehavior', {})
+        assert default_behavior.get('Compress') is True, \
+            f"CloudFront distribution {distribution_id} default cache behavior does not compress objects"
+        
+        logger.info("✓ Default cache behavior compresses objects")
     
-    # Get distribution configuration
-    try:
-        response = aws_validator.cloudfront.get_distribution(Id=distribution_id)
-        distribution = response['Distribution']
-        config = distribution['DistributionConfig']
-    except ClientError as e:
-        pytest.fail(f"Failed to get distribution configuration: {e}")
-    
-    # Verify distribution is enabled
-    assert config['Enabled'], \
-        f"CloudFront distribution {distribution_id} is not enabled"
-    
-    # Verify price class is PriceClass_100 (cost optimization)
-    price_class = config.get('PriceClass', '')
-    assert price_class == 'PriceClass_100', \
-        f"CloudFront distribution uses {price_class} (expected PriceClass_100 for cost optimization)"
-    
-    # Verify HTTPS-only viewer protocol
-    default_behavior = config.get('DefaultCacheBehavior', {})
-    viewer_protocol_policy = default_behavior.get('ViewerProtocolPolicy', '')
-    assert viewer_protocol_policy in ['https-only', 'redirect-to-https'], \
-        f"CloudFront distribution viewer protocol is {viewer_protocol_policy} (expected https-only or redirect-to-https)"
-    
-    # Verify TLS 1.2 minimum
-    minimum_protocol_version = config.get('ViewerCertificate', {}).get('MinimumProtocolVersion', '')
-    assert 'TLSv1.2' in minimum_protocol_version, \
-        f"CloudFront distribution minimum protocol version is {minimum_protocol_version} (expected TLSv1.2 or higher)"
-    
-    print(f"✓ CloudFront distribution {distribution_id} is deployed and enabled")
-    print(f"✓ Price class: {price_class} (cost optimized)")
-    print(f"✓ Viewer protocol policy: {viewer_protocol_policy} (HTTPS enforced)")
-    print(f"✓ Minimum protocol version: {minimum_protocol_version} (TLS 1.2+)")
+    else:
+        pytest.fail(f"Unknown configuration check: {check}")
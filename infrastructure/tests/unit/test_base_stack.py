@@ -211,3 +211,50 @@ def test_base_stack_with_different_environments():
         resource_name = stack.get_resource_name("vpc")
         expected = f"showcore-network-{environment}-vpc"
         assert resource_name == expected
+
+
+def test_get_context_values():
+    """Test that context values fall back to defaults only when unset."""
+    app = cdk.App(context={
+        "vpc_cidr": "10.1.0.0/16",
+        "enable_nat_gateway": False
+    })
+    
+    stack = ShowCoreBaseStack(
+        app,
+        "TestStack",
+        component="Network"
+    )
+    
+    config = stack.get_context_values({
+        "vpc_cidr": "10.0.0.0/16",
+        "enable_nat_gateway": True,
+        "missing_key": "default"
+    })
+    
+    # Context values override defaults, including explicit False
+    assert config["vpc_cidr"] == "10.1.0.0/16"
+    assert config["enable_nat_gateway"] is False
+    
+    # Missing keys use the default
+    assert config["missing_key"] == "default"
+
+
+def test_get_resource_name_cache_reset_on_component_change():
+    """Test that cached resource names follow component changes."""
+    app = cdk.App()
+    
+    stack = ShowCoreBaseStack(
+        app,
+        "TestStack",
+        component="Network",
+        environment="production"
+    )
+    
+    # Repeated calls return the same name
+    assert stack.get_resource_name("vpc") == "showcore-network-production-vpc"
+    assert stack.get_resource_name("vpc") == "showcore-network-production-vpc"
+    
+    # Changing the component regenerates names
+    stack.add_component_tag("Database")
+    assert stack.get_resource_name("vpc") == "showcore-database-production-vpc"
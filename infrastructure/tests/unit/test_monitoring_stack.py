@@ -321,6 +321,24 @@ def test_cloudwatch_dashboard_has_widgets():
     assert "DashboardBody" in dashboard_resource["Properties"]
 
 
+def test_cloudwatch_dashboard_can_be_disabled():
+    """Test that the dashboard is skipped when enable_dashboard is false."""
+    app = cdk.App(context={
+        "enable_dashboard": False
+    })
+    stack = ShowCoreMonitoringStack(app, "TestStack")
+    template = Template.from_stack(stack)
+
+    # No dashboard or dashboard URL output should be created
+    template.resource_count_is("AWS::CloudWatch::Dashboard", 0)
+    assert "DashboardUrl" not in template.find_outputs("*")
+    assert stack.dashboard is None
+
+    # Alarms are still created
+    alarms = template.find_resources("AWS::CloudWatch::Alarm")
+    assert len(alarms) > 10, "Alarms should not depend on the dashboard flag"
+
+
 def test_log_retention_configured():
     """Test that log retention is set to 7 days for all log groups."""
     app = cdk.App()
@@ -387,6 +405,20 @@ def test_stack_outputs_exported():
     assert "DashboardUrl" in outputs
 
 
+def test_sns_topic_outputs_not_exported():
+    """Test that SNS topic ARN outputs do not create named CloudFormation exports."""
+    app = cdk.App()
+    stack = ShowCoreMonitoringStack(app, "TestStack")
+    template = Template.from_stack(stack)
+
+    outputs = template.find_outputs("*")
+
+    # Dependent stacks receive the topic constructs directly, so no named
+    # exports are needed for the topic ARNs
+    for output_id in ["CriticalAlertsTopicArn", "WarningAlertsTopicArn", "BillingAlertsTopicArn"]:
+        assert "Export" not in outputs[output_id], f"{output_id} should not be exported"
+
+
 def test_standard_tags_applied():
     """Test that standard tags are applied to the stack."""
     app = cdk.App()
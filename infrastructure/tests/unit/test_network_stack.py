@@ -16,6 +16,7 @@ Validates: Requirements 2.1, 2.2, 2.3, 2.4, 2.5, 2.6, 2.7, 2.8, 2.9
 """
 
 import aws_cdk as cdk
+from aws_cdk import aws_ec2 as ec2
 from aws_cdk.assertions import Template, Match
 from lib.stacks.network_stack import ShowCoreNetworkStack
 
@@ -752,3 +753,230 @@ def test_network_stack_resource_count():
     # Note: CDK may create additional security groups, so we check for at least 1
     resources = template.find_resources("AWS::EC2::SecurityGroup")
     assert len(resources) >= 1, "Should have at least 1 security group (VPC Endpoint SG)"
+
+
+def test_subnet_properties_cached():
+    """
+    Test public_subnets and private_subnets return cached immutable tuples.
+    """
+    app = cdk.App()
+    stack = ShowCoreNetworkStack(app, "TestNetworkStack")
+    
+    # Both properties expose the two subnets created per type
+    assert isinstance(stack.public_subnets, tuple)
+    assert isinstance(stack.private_subnets, tuple)
+    assert len(stack.public_subnets) == 2
+    assert len(stack.private_subnets) == 2
+    
+    # Repeated access returns the same cached object
+    assert stack.public_subnets is stack.public_subnets
+    assert stack.private_subnets is stack.private_subnets
+
+
+def test_vpc_outputs_export_name_suffix():
+    """
+    Test export names include env_suffix so multiple environments can coexist.
+    """
+    app = cdk.App(context={"env_suffix": "Staging"})
+    stack = ShowCoreNetworkStack(app, "TestNetworkStack")
+    template = Template.from_stack(stack)
+    
+    template.has_output("VpcId", {
+        "Export": {
+            "Name": "ShowCoreStagingVpcId"
+        }
+    })
+    
+    template.has_output("PublicSubnetIds", {
+        "Export": {
+            "Name": "ShowCoreStagingPublicSubnetIds"
+        }
+    })
+    
+    template.has_output("PrivateSubnetIds", {
+        "Export": {
+            "Name": "ShowCoreStagingPrivateSubnetIds"
+        }
+    })
+
+
+def test_vpc_name_tag():
+    """
+    Test VPC carries a Name tag following the naming convention.
+    """
+    app = cdk.App()
+    stack = ShowCoreNetworkStack(app, "TestNetworkStack")
+    template = Template.from_stack(stack)
+    
+    template.has_resource_properties("AWS::EC2::VPC", {
+        "Tags": Match.array_with([
+            {"Key": "Name", "Value": "showcore-network-production-vpc"}
+        ])
+    })
+
+
+def test_add_interface_endpoints_shares_security_group():
+    """
+    Test add_interface_endpoints reuses the VPC Endpoint security group.
+    """
+    baseline_stack = ShowCoreNetworkStack(cdk.App(), "BaselineNetworkStack")
+    security_group_count = len(Template.from_stack(baseline_stack).find_resources("AWS::EC2::SecurityGroup"))
+    
+    app = cdk.App()
+    stack = ShowCoreNetworkStack(app, "TestNetworkStack")
+    endpoints = stack.add_interface_endpoints([
+        ("SecretsManagerEndpoint", ec2.InterfaceVpcEndpointAwsService.SECRETS_MANAGER),
+        ("EcrApiEndpoint", ec2.InterfaceVpcEndpointAwsService.ECR),
+    ])
+    template = Template.from_stack(stack)
+    
+    assert set(endpoints) == {"SecretsManagerEndpoint", "EcrApiEndpoint"}
+    
+    # 5 existing endpoints + 2 new Interface Endpoints
+    template.resource_count_is("AWS::EC2::VPCEndpoint", 7)
+    
+    # No additional security groups are created
+    assert len(template.find_resources("AWS::EC2::SecurityGroup")) == security_group_count
+
+
+def test_nat_gateway_mode_skips_interface_endpoints():
+    """
+    Test NAT mode skips Interface Endpoints and wires Gateway Endpoints to egress subnets.
+    """
+    app = cdk.App(context={"enable_nat_gateway": True})
+    stack = ShowCoreNetworkStack(app, "TestNetworkStack")
+    template = Template.from_stack(stack)
+    
+    template.resource_count_is("AWS::EC2::NatGateway", 1)
+    
+    # Only the S3 and DynamoDB Gateway Endpoints remain
+    template.resource_count_is("AWS::EC2::VPCEndpoint", 2)
+    assert stack.interface_endpoints == {}
+    assert stack.vpc_endpoint_security_group is None
+    
+    # Private subnets are the PRIVATE_WITH_EGRESS subnets
+    assert len(stack.private_subnets) == 2
+    # jsii getters return new proxy objects, so compare construct paths
+    assert [subnet.node.path for subnet in stack.private_subnets] == [
+        subnet.node.path for subnet in stack.vpc.private_subnets
+    ]
+
+
+def test_string_context_flags_from_cli():
+    """
+    Test -c flag=false / -c flag=true strings are read as booleans.
+    """
+    app = cdk.App(context={"enable_nat_gateway": "false"})
+    stack = ShowCoreNetworkStack(app, "TestNetworkStack")
+    template = Template.from_stack(stack)
+    
+    template.resource_count_is("AWS::EC2::NatGateway", 0)
+    assert stack.vpc.private_subnets == []
+    
+    app = cdk.App(context={"enable_nat_gateway": "true"})
+    stack = ShowCoreNetworkStack(app, "TestNetworkStack")
+    Template.from_stack(stack).resource_count_is("AWS::EC2::NatGateway", 1)
+
+
+def test_network_config_parameters():
+    """
+    Test the VPC ID and each subnet group are published as separate SSM parameters.
+    """
+    app = cdk.App()
+    stack = ShowCoreNetworkStack(app, "TestNetworkStack")
+    template = Template.from_stack(stack)
+    
+    template.resource_count_is("AWS::SSM::Parameter", 3)
+    template.has_resource_properties("AWS::SSM::Parameter", {
+        "Name": "/showcore/production/network/vpc-id",
+        "Type": "String",
+        "Value": {"Ref": Match.string_like_regexp("^VPC")}
+    })
+    
+    # Each subnet group holds exactly the subnets of that group
+    for name, subnet_ids in (
+        ("public-subnet-ids", stack.public_subnet_ids),
+        ("private-subnet-ids", stack.private_subnet_ids),
+    ):
+        template.has_resource_properties("AWS::SSM::Parameter", {
+            "Name": f"/showcore/production/network/{name}",
+            "Type": "String",
+            "Value": {"Fn::Join": [",", [
+                stack.resolve(subnet_id) for subnet_id in subnet_ids
+            ]]}
+        })
+    
+    # Outputs are still exported for existing consumers
+    template.has_output("VpcId", {"Export": {"Name": "ShowCoreVpcId"}})
+
+
+def test_interface_endpoints_can_be_disabled():
+    """
+    Test enable_interface_endpoints=false skips the Interface Endpoints and their security group.
+    """
+    app = cdk.App(context={"enable_interface_endpoints": False})
+    stack = ShowCoreNetworkStack(app, "TestNetworkStack")
+    template = Template.from_stack(stack)
+    
+    # Only the S3 and DynamoDB Gateway Endpoints remain
+    template.resource_count_is("AWS::EC2::VPCEndpoint", 2)
+    assert stack.interface_endpoints == {}
+    assert stack.vpc_endpoint_security_group is None
+    
+    # No NAT Gateway is added to compensate
+    template.resource_count_is("AWS::EC2::NatGateway", 0)
+
+
+def test_explicit_availability_zones():
+    """
+    Test availability_zones context pins the subnets to the given zones.
+    """
+    app = cdk.App(context={"availability_zones": ["us-east-1a", "us-east-1b"]})
+    stack = ShowCoreNetworkStack(app, "TestNetworkStack")
+    template = Template.from_stack(stack)
+    
+    template.resource_count_is("AWS::EC2::Subnet", 4)
+    assert [subnet.availability_zone for subnet in stack.public_subnets] == ["us-east-1a", "us-east-1b"]
+    assert [subnet.availability_zone for subnet in stack.private_subnets] == ["us-east-1a", "us-east-1b"]
+
+
+def test_import_existing_vpc():
+    """
+    Test import_existing references a deployed VPC without creating network resources.
+    """
+    app = cdk.App()
+    consumer_stack = cdk.Stack(app, "ConsumerStack")
+    vpc = ShowCoreNetworkStack.import_existing(
+        consumer_stack,
+        "ImportedVpc",
+        vpc_id="vpc-12345678",
+        public_subnet_ids=["subnet-public-a", "subnet-public-b"],
+        private_subnet_ids=["subnet-private-a", "subnet-private-b"],
+        availability_zones=["us-east-1a", "us-east-1b"],
+    )
+    
+    assert vpc.vpc_id == "vpc-12345678"
+    assert [subnet.subnet_id for subnet in vpc.public_subnets] == ["subnet-public-a", "subnet-public-b"]
+    assert [subnet.subnet_id for subnet in vpc.isolated_subnets] == ["subnet-private-a", "subnet-private-b"]
+    
+    # Importing does not synthesize any VPC resources
+    template = Template.from_stack(consumer_stack)
+    template.resource_count_is("AWS::EC2::VPC", 0)
+    template.resource_count_is("AWS::EC2::Subnet", 0)
+
+
+def test_disable_private_dns_outputs_endpoint_dns_names():
+    """
+    Test disable_private_dns turns off private DNS and outputs each endpoint's DNS name.
+    """
+    app = cdk.App(context={"disable_private_dns": True})
+    stack = ShowCoreNetworkStack(app, "TestNetworkStack")
+    template = Template.from_stack(stack)
+    
+    template.has_resource_properties("AWS::EC2::VPCEndpoint", {
+        "VpcEndpointType": "Interface",
+        "PrivateDnsEnabled": False
+    })
+    
+    for endpoint_id in ("CloudWatchLogsEndpoint", "CloudWatchMonitoringEndpoint", "SystemsManagerEndpoint"):
+        template.has_output(f"{endpoint_id}DnsName", {})
@@ -176,6 +176,27 @@ def test_cloudtrail_trail_created():
     })
 
 
+def test_cloudtrail_logs_write_events_only_outside_production():
+    """Test non-production trails skip read-only management events by default."""
+    def trail_template(context: dict) -> Template:
+        app = cdk.App(context=context)
+        vpc = _create_test_vpc(app)
+        stack = ShowCoreSecurityStack(app, "TestSecurityStack", vpc=vpc)
+        return Template.from_stack(stack)
+    
+    trail_template({}).has_resource_properties("AWS::CloudTrail::Trail", {
+        "EventSelectors": [Match.object_like({"ReadWriteType": "All"})]
+    })
+    trail_template({"environment": "development"}).has_resource_properties("AWS::CloudTrail::Trail", {
+        "EventSelectors": [Match.object_like({"ReadWriteType": "WriteOnly"})]
+    })
+    trail_template({"environment": "development", "cloudtrail_read_events": True}).has_resource_properties(
+        "AWS::CloudTrail::Trail", {
+            "EventSelectors": [Match.object_like({"ReadWriteType": "All"})]
+        }
+    )
+
+
 def test_cloudtrail_bucket_created():
     """Test S3 bucket for CloudTrail logs is created."""
     app = cdk.App()
@@ -187,6 +208,57 @@ def test_cloudtrail_bucket_created():
     template.resource_count_is("AWS::S3::Bucket", 2)
 
 
+def _create_regional_template(region: str, context: dict = None) -> Template:
+    """Synthesize the security stack for a concrete account and region."""
+    app = cdk.App(context=context)
+    env = cdk.Environment(account="123456789012", region=region)
+    vpc_stack = cdk.Stack(app, "TestVpcStack", env=env)
+    vpc = ec2.Vpc(vpc_stack, "TestVpc", max_azs=2)
+    stack = ShowCoreSecurityStack(app, "TestSecurityStack", vpc=vpc, env=env)
+    return Template.from_stack(stack)
+
+
+def test_cloudtrail_bucket_name_has_region_suffix_outside_primary_region():
+    """Test CloudTrail bucket names only get a region suffix outside the primary region."""
+    context = {"primary_region": "us-east-1"}
+    _create_regional_template("us-east-1", context).has_resource_properties("AWS::S3::Bucket", {
+        "BucketName": "showcore-cloudtrail-logs-123456789012"
+    })
+    _create_regional_template("us-west-2", context).has_resource_properties("AWS::S3::Bucket", {
+        "BucketName": "showcore-cloudtrail-logs-123456789012-us-west-2"
+    })
+
+
+def test_cloudtrail_bucket_name_unchanged_for_single_region_deploy():
+    """Test a single-region deploy outside us-east-1 keeps the unsuffixed bucket name."""
+    template = _create_regional_template("eu-west-1", {"region": "eu-west-1"})
+    template.has_resource_properties("AWS::S3::Bucket", {
+        "BucketName": "showcore-cloudtrail-logs-123456789012"
+    })
+
+
+def test_cloudtrail_trail_is_single_region_outside_primary_region():
+    """Test non-primary regions don't duplicate multi-region and global service events."""
+    context = {"primary_region": "us-east-1"}
+    _create_regional_template("us-east-1", context).has_resource_properties("AWS::CloudTrail::Trail", {
+        "IsMultiRegionTrail": True,
+        "IncludeGlobalServiceEvents": True
+    })
+    _create_regional_template("us-west-2", context).has_resource_properties("AWS::CloudTrail::Trail", {
+        "IsMultiRegionTrail": False,
+        "IncludeGlobalServiceEvents": False
+    })
+
+
+def test_cloudtrail_trail_is_multi_region_for_single_region_deploy():
+    """Test a single-region deploy outside us-east-1 keeps the multi-region trail."""
+    template = _create_regional_template("eu-west-1", {"region": "eu-west-1"})
+    template.has_resource_properties("AWS::CloudTrail::Trail", {
+        "IsMultiRegionTrail": True,
+        "IncludeGlobalServiceEvents": True
+    })
+
+
 def test_cloudtrail_bucket_has_versioning():
     """Test CloudTrail S3 bucket has versioning enabled."""
     app = cdk.App()
@@ -262,6 +334,107 @@ def test_cloudtrail_bucket_has_lifecycle_policy():
     })
 
 
+def test_cloudtrail_bucket_expires_noncurrent_versions():
+    """Test CloudTrail S3 bucket deletes noncurrent log versions after 30 days."""
+    app = cdk.App()
+    vpc = _create_test_vpc(app)
+    stack = ShowCoreSecurityStack(app, "TestSecurityStack", vpc=vpc)
+    template = Template.from_stack(stack)
+    
+    template.has_resource_properties("AWS::S3::Bucket", {
+        "LifecycleConfiguration": {
+            "Rules": Match.array_with([
+                Match.object_like({
+                    "Id": "DeleteOldLogs",
+                    "NoncurrentVersionExpiration": {
+                        "NoncurrentDays": 30
+                    }
+                })
+            ])
+        }
+    })
+
+
+def test_cloudtrail_bucket_aborts_incomplete_multipart_uploads():
+    """Test CloudTrail S3 bucket cleans up incomplete multipart uploads after 7 days."""
+    app = cdk.App()
+    vpc = _create_test_vpc(app)
+    stack = ShowCoreSecurityStack(app, "TestSecurityStack", vpc=vpc)
+    template = Template.from_stack(stack)
+    
+    template.has_resource_properties("AWS::S3::Bucket", {
+        "LifecycleConfiguration": {
+            "Rules": Match.array_with([
+                Match.object_like({
+                    "Id": "DeleteOldLogs",
+                    "Status": "Enabled",
+                    "AbortIncompleteMultipartUpload": {
+                        "DaysAfterInitiation": 7
+                    }
+                })
+            ])
+        }
+    })
+
+
+def test_cloudtrail_bucket_has_single_lifecycle_rule():
+    """Test CloudTrail S3 bucket expresses its lifecycle in one rule."""
+    app = cdk.App()
+    vpc = _create_test_vpc(app)
+    stack = ShowCoreSecurityStack(app, "TestSecurityStack", vpc=vpc)
+    template = Template.from_stack(stack)
+    
+    buckets = template.find_resources("AWS::S3::Bucket")
+    cloudtrail_buckets = [
+        resource for logical_id, resource in buckets.items()
+        if logical_id.startswith("CloudTrailBucket")
+    ]
+    assert len(cloudtrail_buckets) == 1
+    assert len(cloudtrail_buckets[0]["Properties"]["LifecycleConfiguration"]["Rules"]) == 1
+
+
+def test_cloudtrail_log_notifications_sent_to_sqs():
+    """Test new CloudTrail log files are announced on an encrypted SQS queue."""
+    app = cdk.App()
+    vpc = _create_test_vpc(app)
+    stack = ShowCoreSecurityStack(app, "TestSecurityStack", vpc=vpc)
+    template = Template.from_stack(stack)
+    
+    template.has_resource_properties("AWS::SQS::Queue", {
+        "QueueName": "showcore-security-production-cloudtrail-notifications",
+        "SqsManagedSseEnabled": True,
+        "VisibilityTimeout": 300
+    })
+    
+    template.has_resource_properties("Custom::S3BucketNotifications", {
+        "NotificationConfiguration": {
+            "QueueConfigurations": [
+                Match.object_like({
+                    "Events": ["s3:ObjectCreated:*"],
+                    "Filter": {
+                        "Key": {
+                            # CDK renders the suffix rule before the prefix rule
+                            "FilterRules": Match.array_with([
+                                {"Name": "suffix", "Value": ".json.gz"},
+                                # Excludes AWSLogs/<account>/CloudTrail-Digest/
+                                {"Name": "prefix", "Value": {"Fn::Join": ["", [
+                                    "AWSLogs/",
+                                    {"Ref": "AWS::AccountId"},
+                                    "/CloudTrail/"
+                                ]]}}
+                            ])
+                        }
+                    }
+                })
+            ]
+        }
+    })
+    
+    template.has_resource_properties("AWS::SSM::Parameter", {
+        "Name": "/showcore/production/security/cloudtrail-notifications-queue-arn"
+    })
+
+
 def test_cloudtrail_bucket_has_policy():
     """Test CloudTrail S3 bucket has policy allowing CloudTrail to write logs."""
     app = cdk.App()
@@ -292,6 +465,51 @@ def test_cloudtrail_bucket_has_policy():
     })
 
 
+def test_cloudtrail_bucket_has_daily_inventory():
+    """Test CloudTrail S3 bucket publishes a daily inventory of current log objects."""
+    app = cdk.App()
+    vpc = _create_test_vpc(app)
+    stack = ShowCoreSecurityStack(app, "TestSecurityStack", vpc=vpc)
+    template = Template.from_stack(stack)
+    
+    template.has_resource_properties("AWS::S3::Bucket", {
+        "InventoryConfigurations": [
+            Match.object_like({
+                "Id": "DailyCloudTrailLogInventory",
+                "Enabled": True,
+                "IncludedObjectVersions": "Current",
+                "ScheduleFrequency": "Daily",
+                "Destination": Match.object_like({
+                    "Format": "CSV",
+                    "Prefix": "inventory"
+                })
+            })
+        ]
+    })
+    
+    # Destination ARN must not reference the bucket's own GetAtt (circular dependency)
+    buckets = template.find_resources("AWS::S3::Bucket", {
+        "Properties": {"InventoryConfigurations": Match.any_value()}
+    })
+    for bucket in buckets.values():
+        for inventory in bucket["Properties"]["InventoryConfigurations"]:
+            assert "Fn::GetAtt" not in str(inventory["Destination"]["BucketArn"])
+    
+    # S3 may write inventory reports under inventory/
+    template.has_resource_properties("AWS::S3::BucketPolicy", {
+        "PolicyDocument": {
+            "Statement": Match.array_with([
+                Match.object_like({
+                    "Sid": "S3InventoryWrite",
+                    "Effect": "Allow",
+                    "Principal": {"Service": "s3.amazonaws.com"},
+                    "Action": "s3:PutObject"
+                })
+            ])
+        }
+    })
+
+
 # ============================================================================
 # AWS Config Tests (Requirements 6.3)
 # ============================================================================
@@ -507,6 +725,52 @@ def test_session_manager_role_outputs_exported():
     assert "SessionManagerRoleName" in outputs
 
 
+def test_rds_connectivity_test_instance_profile_created():
+    """Test reusable IAM role and instance profile for RDS connectivity tests are created."""
+    app = cdk.App(context={"create_test_support_role": True})
+    vpc = _create_test_vpc(app)
+    stack = ShowCoreSecurityStack(app, "TestSecurityStack", vpc=vpc)
+    template = Template.from_stack(stack)
+    
+    # Verify test role trusts EC2 and has Session Manager core policy
+    template.has_resource_properties("AWS::IAM::Role", {
+        "RoleName": "showcore-security-production-rds-connectivity-test-role",
+        "AssumeRolePolicyDocument": {
+            "Statement": Match.array_with([
+                Match.object_like({
+                    "Effect": "Allow",
+                    "Principal": {
+                        "Service": "ec2.amazonaws.com"
+                    },
+                    "Action": "sts:AssumeRole"
+                })
+            ])
+        },
+        # Managed policy ARNs render as Fn::Join with the partition
+        "ManagedPolicyArns": Match.array_with([
+            {"Fn::Join": ["", Match.array_with([
+                Match.string_like_regexp(".*AmazonSSMManagedInstanceCore")
+            ])]}
+        ])
+    })
+    
+    # Verify instance profile uses the fixed name the integration tests look up
+    template.has_resource_properties("AWS::IAM::InstanceProfile", {
+        "InstanceProfileName": "showcore-security-production-rds-connectivity-test-role"
+    })
+
+
+def test_rds_connectivity_test_role_not_created_by_default():
+    """Test the test-only RDS connectivity role is not created without create_test_support_role."""
+    app = cdk.App()
+    vpc = _create_test_vpc(app)
+    stack = ShowCoreSecurityStack(app, "TestSecurityStack", vpc=vpc)
+    template = Template.from_stack(stack)
+    
+    assert stack.rds_connectivity_test_role is None
+    template.resource_count_is("AWS::IAM::InstanceProfile", 0)
+
+
 # ============================================================================
 # Stack Outputs Tests
 # ============================================================================
@@ -539,6 +803,27 @@ def test_stack_exports_all_required_outputs():
     assert "SessionManagerRoleName" in outputs
 
 
+def test_cloudtrail_values_published_to_ssm():
+    """Test CloudTrail bucket name and trail ARN are published as SSM parameters, not exports."""
+    app = cdk.App()
+    vpc = _create_test_vpc(app)
+    stack = ShowCoreSecurityStack(app, "TestSecurityStack", vpc=vpc)
+    template = Template.from_stack(stack)
+    
+    template.has_resource_properties("AWS::SSM::Parameter", {
+        "Name": "/showcore/production/security/cloudtrail-bucket-name",
+        "Type": "String"
+    })
+    template.has_resource_properties("AWS::SSM::Parameter", {
+        "Name": "/showcore/production/security/cloudtrail-arn",
+        "Type": "String"
+    })
+    
+    outputs = template.find_outputs("*")
+    assert "Export" not in outputs["CloudTrailBucketName"]
+    assert "Export" not in outputs["CloudTrailArn"]
+
+
 # ============================================================================
 # Integration Tests
 # ============================================================================
@@ -13,6 +13,7 @@ Usage:
 
 import boto3
 from typing import Dict, List, Optional, Any
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 
@@ -24,16 +25,24 @@ class AWSResourceValidator:
     It's designed for use in integration tests that run after infrastructure deployment.
     """
     
-    def __init__(self, region: str = 'us-east-1', profile: Optional[str] = None):
+    def __init__(
+        self,
+        region: str = 'us-east-1',
+        profile: Optional[str] = None,
+        botocore_config: Optional[Config] = None
+    ):
         """
         Initialize AWS resource validator.
         
         Args:
             region: AWS region to query (default: us-east-1)
             profile: AWS profile name to use (default: None, uses default profile)
+            botocore_config: botocore Config applied to every client
+                (default: None, uses botocore defaults)
         """
         self.region = region
         self.session = boto3.Session(profile_name=profile, region_name=region)
+        self.botocore_config = botocore_config
         
         # Initialize clients (lazy loading)
         self._ec2_client = None
@@ -47,84 +56,92 @@ class AWSResourceValidator:
         self._config_client = None
         self._backup_client = None
         self._tagging_client = None
+        self._ssm_client = None
     
     @property
     def ec2(self):
         """Get EC2 client (lazy loading)."""
         if self._ec2_client is None:
-            self._ec2_client = self.session.client('ec2')
+            self._ec2_client = self.session.client('ec2', config=self.botocore_config)
         return self._ec2_client
     
     @property
     def rds(self):
         """Get RDS client (lazy loading)."""
         if self._rds_client is None:
-            self._rds_client = self.session.client('rds')
+            self._rds_client = self.session.client('rds', config=self.botocore_config)
         return self._rds_client
     
     @property
     def elasticache(self):
         """Get ElastiCache client (lazy loading)."""
         if self._elasticache_client is None:
-            self._elasticache_client = self.session.client('elasticache')
+            self._elasticache_client = self.session.client('elasticache', config=self.botocore_config)
         return self._elasticache_client
     
     @property
     def s3(self):
         """Get S3 client (lazy loading)."""
         if self._s3_client is None:
-            self._s3_client = self.session.client('s3')
+            self._s3_client = self.session.client('s3', config=self.botocore_config)
         return self._s3_client
     
     @property
     def cloudfront(self):
         """Get CloudFront client (lazy loading)."""
         if self._cloudfront_client is None:
-            self._cloudfront_client = self.session.client('cloudfront')
+            self._cloudfront_client = self.session.client('cloudfront', config=self.botocore_config)
         return self._cloudfront_client
     
     @property
     def cloudwatch(self):
         """Get CloudWatch client (lazy loading)."""
         if self._cloudwatch_client is None:
-            self._cloudwatch_client = self.session.client('cloudwatch')
+            self._cloudwatch_client = self.session.client('cloudwatch', config=self.botocore_config)
         return self._cloudwatch_client
     
     @property
     def sns(self):
         """Get SNS client (lazy loading)."""
         if self._sns_client is None:
-            self._sns_client = self.session.client('sns')
+            self._sns_client = self.session.client('sns', config=self.botocore_config)
         return self._sns_client
     
     @property
     def cloudtrail(self):
         """Get CloudTrail client (lazy loading)."""
         if self._cloudtrail_client is None:
-            self._cloudtrail_client = self.session.client('cloudtrail')
+            self._cloudtrail_client = self.session.client('cloudtrail', config=self.botocore_config)
         return self._cloudtrail_client
     
     @property
     def config(self):
         """Get AWS Config client (lazy loading)."""
         if self._config_client is None:
-            self._config_client = self.session.client('config')
+            self._config_client = self.session.client('config', config=self.botocore_config)
         return self._config_client
     
     @property
     def backup(self):
         """Get AWS Backup client (lazy loading)."""
         if self._backup_client is None:
-            self._backup_client = self.session.client('backup')
+            self._backup_client = self.session.client('backup', config=self.botocore_config)
         return self._backup_client
     
     @property
     def tagging(self):
         """Get Resource Groups Tagging API client (lazy loading)."""
         if self._tagging_client is None:
-            self._tagging_client = self.session.client('resourcegroupstaggingapi')
+            self._tagging_client = self.session.client('resourcegroupstaggingapi', config=self.botocore_config)
         return self._tagging_client
     
+    @property
+    def ssm(self):
+        """Get Systems Manager client (lazy loading)."""
+        if self._ssm_client is None:
+            self._ssm_client = self.session.client('ssm', config=self.botocore_config)
+        return self._ssm_client
+    
     # VPC and Network Methods
     
     def get_vpc_by_tag(self, tag_key: str, tag_value: str) -> Optional[Dict[str, Any]]: